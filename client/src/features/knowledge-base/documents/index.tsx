@@ -8,7 +8,7 @@ import { KBProvider } from './components/kb-provider'
 import { KBPrimaryButtons } from './components/kb-primary-buttons'
 import { KBTable } from './components/kb-table'
 import { KBDialogs } from './components/kb-dialogs'
-import type { Document as BackendDocument, DocumentListParams } from '@/types/document.types'
+import type { DocumentListItem, DocumentListParams } from '@/types/document.types'
 import type { Document as TableDocument } from './data/schema'
 
 const route = getRouteApi('/_authenticated/knowledge-base/document')
@@ -17,7 +17,7 @@ const route = getRouteApi('/_authenticated/knowledge-base/document')
  * Transform backend document data to match table schema
  * Extracts title from filename (removes extension)
  */
-function transformDocumentData(backendDoc: BackendDocument): TableDocument {
+function transformDocumentData(backendDoc: DocumentListItem): TableDocument {
   return {
     id: backendDoc.id,
     userId: backendDoc.user_id,
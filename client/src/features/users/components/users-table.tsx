@@ -64,6 +64,7 @@ export function UsersTable({ data, search, navigate, pageCount }: DataTableProps
       // Map column IDs to backend sort fields
       const sortByMap: Record<string, string> = {
         email: 'email',
+        fullName: 'first_name',
         firstName: 'first_name',
         lastName: 'last_name',
         status: 'is_active',
@@ -139,7 +140,7 @@ export function UsersTable({ data, search, navigate, pageCount }: DataTableProps
       // Map backend sort fields to column IDs
       const sortByMap: Record<string, string> = {
         email: 'email',
-        first_name: 'firstName',
+        first_name: 'fullName',
         last_name: 'lastName',
         phone_number: 'phoneNumber',
         is_active: 'status',
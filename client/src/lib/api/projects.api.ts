@@ -5,12 +5,20 @@ import type {
     ProjectUpdate,
 } from '@/features/projects/types/project-types'
 
+type ProjectPage = {
+    items: Project[]
+    skip: number
+    limit: number
+    next_cursor: string | null
+    has_more: boolean
+}
+
 export const projectsApi = {
     listProjects: async (skip = 0, limit = 100): Promise<Project[]> => {
-        const response = await apiClient.get<Project[]>('/projects', {
+        const response = await apiClient.get<ProjectPage>('/projects', {
             params: { skip, limit },
         })
-        return response.data
+        return response.data.items
     },
 
     getProject: async (id: string): Promise<Project> => {
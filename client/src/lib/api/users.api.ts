@@ -36,6 +36,8 @@ export const usersApi = {
     const queryParams: Record<string, unknown> = {
       skip: params?.skip ?? 0,
       limit: params?.limit ?? 20,
+      // The table paginates by page number, so it needs the exact total
+      include_total: true,
     }
 
     // Add search parameter
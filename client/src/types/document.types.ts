@@ -18,6 +18,11 @@ export interface Document {
   updated_at: string
 }
 
+/**
+ * Document as returned by the list endpoint (no metadata payload)
+ */
+export type DocumentListItem = Omit<Document, 'qdrant_collection' | 'metadata'>
+
 export interface DocumentUpload {
   file: File
   title: string
@@ -38,7 +43,7 @@ export interface DocumentListParams {
 }
 
 export interface PaginatedDocuments {
-  items: Document[]
+  items: DocumentListItem[]
   total: number
   page: number
   size: number
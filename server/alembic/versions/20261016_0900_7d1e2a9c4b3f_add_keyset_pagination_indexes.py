@@ -0,0 +1,28 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: 7d1e2a9c4b3f
+Revises: 4c590efe6521
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d1e2a9c4b3f'
+down_revision: Union[str, None] = '4c590efe6521'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite indexes backing ORDER BY created_at DESC, id DESC keyset seeks
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
+    op.drop_index('ix_users_created_at_id', table_name='users')
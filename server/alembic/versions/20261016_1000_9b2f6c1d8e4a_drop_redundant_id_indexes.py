@@ -0,0 +1,39 @@
+"""drop redundant indexes on primary key id columns
+
+Revision ID: 9b2f6c1d8e4a
+Revises: 7d1e2a9c4b3f
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2f6c1d8e4a'
+down_revision: Union[str, None] = '7d1e2a9c4b3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table's primary key constraint already indexes id
+TABLES = (
+    'users',
+    'analytics_events',
+    'conversations',
+    'documents',
+    'messages',
+    'feedback',
+    'chat_widgets',
+    'projects',
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(op.f(f'ix_{table}_id'), table_name=table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.create_index(op.f(f'ix_{table}_id'), table, ['id'], unique=False)
@@ -1,14 +1,20 @@
 """API dependencies for authentication and authorization."""
 
+from collections.abc import AsyncIterator
 from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
+from jwt import InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import UserRole
-from app.core.exceptions import AuthenticationError, AuthorizationError
+from app.core.exceptions import (
+    AuthenticationError,
+    AuthorizationError,
+    ResourceAlreadyExistsError,
+    ValidationError,
+)
 from app.core.security import decode_token, verify_token_type
 from app.db.session import get_db
 from app.models.user import User
@@ -85,7 +91,7 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-    except JWTError as e:
+    except InvalidTokenError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Could not validate credentials: {str(e)}",
@@ -176,28 +182,38 @@ def require_role(*allowed_roles: UserRole):
         ```
     """
 
+    # Convert allowed_roles to string values once, when the dependency is built
+    allowed_role_values = frozenset(role.value for role in allowed_roles)
+    forbidden_detail = (
+        "Insufficient permissions - requires one of: "
+        f"{', '.join(role.value for role in allowed_roles)}"
+    )
+
     async def role_checker(
         current_user: Annotated[User, Depends(get_current_active_user)],
     ) -> User:
         """Check if user has required role."""
-        # Convert allowed_roles to string values for comparison
-        allowed_role_values = [role.value for role in allowed_roles]
-
+        # The role is already on the loaded user, so no extra query is needed
         if current_user.role not in allowed_role_values:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions - requires one of: {', '.join(allowed_role_values)}",
+                detail=forbidden_detail,
             )
         return current_user
 
     return role_checker
 
 
+# Shared admin dependency; reusing one callable lets FastAPI resolve it once per request
+_require_admin_dependency = require_role(UserRole.ADMIN)
+
+
 def require_admin():
     """
     Dependency to require admin role.
 
-    Convenience wrapper around require_role for admin-only routes.
+    Convenience wrapper around require_role for admin-only routes. Every call
+    returns the same module-level dependency.
 
     Returns:
         A dependency function that validates admin role
@@ -212,7 +228,7 @@ def require_admin():
             return {"message": "User deleted"}
         ```
     """
-    return require_role(UserRole.ADMIN)
+    return _require_admin_dependency
 
 
 # Optional dependency - returns None if not authenticated
@@ -269,6 +285,26 @@ async def get_optional_user(
 
         # Unknown token type, return None
         return None
-    except (HTTPException, JWTError):
+    except (HTTPException, InvalidTokenError):
         # If authentication fails, just return None
         return None
+
+
+async def client_errors_as_bad_request() -> AsyncIterator[None]:
+    """
+    Dependency reporting validation and conflict errors as 400 Bad Request.
+
+    Attach it to a router to keep that router's historical 400 responses while
+    the errors are still rendered by the application-wide AppException handler.
+    Other routers keep the status code defined on the exception class.
+
+    Example:
+        ```python
+        router = APIRouter(dependencies=[Depends(client_errors_as_bad_request)])
+        ```
+    """
+    try:
+        yield
+    except (ValidationError, ResourceAlreadyExistsError) as e:
+        e.status_code = status.HTTP_400_BAD_REQUEST
+        raise
@@ -5,7 +5,7 @@ from typing import Callable, Optional
 
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
-from jose import JWTError
+from jwt import InvalidTokenError
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.security import decode_token, verify_token_type
@@ -92,7 +92,7 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
                 user = await user_repo.get_by_id(user_id)
                 return user
 
-        except JWTError as e:
+        except InvalidTokenError as e:
             logger.warning("JWT validation failed in middleware: %s", e, exc_info=True)
             return None
         except Exception as e:
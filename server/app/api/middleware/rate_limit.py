@@ -5,7 +5,12 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.cache.rate_limiter import RateLimiter, get_rate_limiter
+from app.cache.rate_limiter import (
+    IP_KEY_PREFIX,
+    USER_KEY_PREFIX,
+    RateLimiter,
+    get_rate_limiter,
+)
 from app.core.config import settings
 from app.core.exceptions import RateLimitError
 from app.core.logging import get_logger
@@ -66,8 +71,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Check IP-based rate limit
         try:
-            is_allowed, current, remaining = await self._rate_limiter.check_rate_limit(
-                identifier=f"ip:{client_ip}",
+            is_allowed, current, remaining = await self._rate_limiter.check_rate_limit_raw(
+                IP_KEY_PREFIX + client_ip.encode(),
                 limit=settings.RATE_LIMIT_PER_IP
             )
 
@@ -221,8 +226,8 @@ class UserRateLimitMiddleware(BaseHTTPMiddleware):
 
         # Check user-based rate limit
         try:
-            is_allowed, current, remaining = await self._rate_limiter.check_rate_limit(
-                identifier=f"user:{user_id}",
+            is_allowed, current, remaining = await self._rate_limiter.check_rate_limit_raw(
+                USER_KEY_PREFIX + str(user_id).encode(),
                 limit=settings.RATE_LIMIT_PER_USER
             )
 
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from typing import Any, Annotated
 
@@ -216,9 +217,9 @@ async def websocket_endpoint(websocket: WebSocket, thread_id: str):
                 if current_json:
                     input_data["final_json"] = json.dumps(current_json) if isinstance(current_json, dict) else current_json
                 
-                # Note: In a production app with high concurrency, this should be run in a threadpool
-                # to avoid blocking the asyncio event loop.
-                final_state = graph.invoke(input_data, config=config)
+                # The graph and its checkpointer are synchronous, so run them in a
+                # worker thread to keep the event loop free for other clients
+                final_state = await asyncio.to_thread(graph.invoke, input_data, config=config)
                 
                 messages = final_state["messages"]
                 last_message = messages[-1]
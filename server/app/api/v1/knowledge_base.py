@@ -6,9 +6,20 @@ from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-import httpx
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
+from qdrant_client.http import models
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -16,6 +27,7 @@ from app.core.exceptions import ResourceNotFoundError, ValidationError
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.knowledge_base import (
+    DocumentListItem,
     DocumentResponse,
     PaginatedDocumentsResponse,
     SearchRequest,
@@ -23,7 +35,7 @@ from app.schemas.knowledge_base import (
     SearchResult as SearchResultSchema,
 )
 from app.services.knowledge_base.kb_service import KnowledgeBaseService
-from app.vector_store.qdrant_client import get_qdrant_client
+from app.vector_store.qdrant_client import get_qdrant_client, get_qdrant_http_client
 from app.core.constants import UserRole
 
 logger = logging.getLogger(__name__)
@@ -45,6 +57,9 @@ async def upload_document(
     chunking_strategy: str = Form("section", description="Chunking strategy: 'section' or 'token'"),
     chunk_size: int = Form(500, description="Chunk size in tokens (for token-based chunking)"),
     chunk_overlap: int = Form(50, description="Chunk overlap in tokens (for token-based chunking)"),
+    content_hash: str | None = Header(
+        None, alias="X-Content-Hash", description="Optional pre-computed file hash"
+    ),
     current_user: User = Depends(get_current_user),
     kb_service: KnowledgeBaseService = Depends(get_kb_service)
 ) -> DocumentResponse:
@@ -65,6 +80,10 @@ async def upload_document(
         chunking_strategy: Chunking strategy - "section" (split by headings) or "token" (split by token count)
         chunk_size: Chunk size in tokens (used for token-based chunking, default: 500)
         chunk_overlap: Chunk overlap in tokens (used for token-based chunking, default: 50)
+        content_hash: Optional client-computed hash of the file (algorithm as reported
+            by HEAD /documents/by-hash). If it matches an existing document, the
+            already-received body is not hashed or processed. To avoid sending the
+            file at all, check HEAD /documents/by-hash/{content_hash} first.
         current_user: Authenticated user
         kb_service: Knowledge base service
 
@@ -101,6 +120,21 @@ async def upload_document(
                 details={"min": 0, "max": chunk_size - 1}
             )
 
+        # Short-circuit known duplicates before hashing and processing the file body
+        if content_hash:
+            existing_doc = await kb_service.check_duplicate_file(
+                content_hash.lower(), current_user.id
+            )
+            if existing_doc:
+                logger.info(
+                    "Duplicate file detected from content hash header "
+                    "(user_id: %s, existing_doc_id: %s)",
+                    current_user.id,
+                    existing_doc.id
+                )
+                await file.close()
+                return DocumentResponse.model_validate(existing_doc)
+
         # Read file content
         file_content = await file.read()
 
@@ -174,6 +208,45 @@ async def upload_document(
         ) from e
 
 
+@router.head("/documents/by-hash/{content_hash}")
+async def check_document_hash(
+    content_hash: str,
+    current_user: User = Depends(get_current_user),
+    kb_service: KnowledgeBaseService = Depends(get_kb_service)
+) -> Response:
+    """
+    Check whether the user already uploaded a file with the given content hash.
+
+    Lets clients hash a file locally and skip the upload entirely for duplicates.
+    The hash algorithm in use is returned in the X-Hash-Algorithm header.
+
+    Args:
+        content_hash: Hex digest of the file content
+        current_user: Authenticated user
+        kb_service: Knowledge base service
+
+    Returns:
+        Empty 200 response with X-Document-Id header if a matching document exists
+
+    Raises:
+        HTTPException: 404 if no document with this hash exists
+    """
+    algorithm_header = {"X-Hash-Algorithm": kb_service.HASH_ALGORITHM}
+    existing_doc = await kb_service.check_duplicate_file(content_hash.lower(), current_user.id)
+
+    if existing_doc is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found",
+            headers=algorithm_header,
+        )
+
+    return Response(
+        status_code=status.HTTP_200_OK,
+        headers={**algorithm_header, "X-Document-Id": str(existing_doc.id)},
+    )
+
+
 @router.get("/documents", response_model=PaginatedDocumentsResponse)
 async def list_documents(
     skip: int = 0,
@@ -208,7 +281,6 @@ async def list_documents(
     """
     try:
         # Admins can see all documents, regular users only their own
-        from app.core.constants import UserRole
         user_id = None if current_user.role in [UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value] else current_user.id
         
         # Limit max page size to 100
@@ -230,7 +302,7 @@ async def list_documents(
         pages = (total + limit - 1) // limit if limit > 0 else 0
 
         return PaginatedDocumentsResponse(
-            items=[DocumentResponse.model_validate(doc) for doc in documents],
+            items=[DocumentListItem.model_validate(doc) for doc in documents],
             total=total,
             page=page,
             size=limit,
@@ -272,7 +344,6 @@ async def get_document_chunks(
         document = await kb_service.get_document(document_id)
         
         # Check ownership (admins can view any document)
-        from app.core.constants import UserRole
         is_admin = current_user.role in [UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value]
         
         if not is_admin and document.user_id != current_user.id:
@@ -284,21 +355,28 @@ async def get_document_chunks(
         # Get Qdrant client and fetch all points for this document
         qdrant = get_qdrant_client()
         
-        # Use scroll to get all points for this document
-        points = []
+        # Build the typed filter once so the client skips dict -> model coercion per batch
+        scroll_filter = models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="document_id",
+                    match=models.MatchValue(value=str(document_id)),
+                )
+            ]
+        )
+
+        # Place each chunk directly at its chunk_index as batches arrive, so we
+        # keep a single copy of the data and skip the final sort. Chunks whose
+        # index falls outside the recorded chunk_count are sorted in at the end.
+        chunk_count = document.chunk_count or 0
+        slots: list[dict | None] = [None] * chunk_count
+        overflow: list[dict] = []
         offset = None
         
         while True:
             result = qdrant.client.scroll(
                 collection_name=qdrant.collection_name,
-                scroll_filter={
-                    "must": [
-                        {
-                            "key": "document_id",
-                            "match": {"value": str(document_id)}
-                        }
-                    ]
-                },
+                scroll_filter=scroll_filter,
                 limit=100,
                 offset=offset,
                 with_payload=True,
@@ -310,25 +388,31 @@ async def get_document_chunks(
             if not batch_points:
                 break
                 
-            points.extend(batch_points)
+            batch_chunks = [
+                {
+                    "id": str(point.id),
+                    "chunk_index": (payload := point.payload).get("chunk_index", 0),
+                    "text": payload.get("text", ""),
+                    "metadata": payload.get("metadata", {}),
+                }
+                for point in batch_points
+            ]
+            for chunk in batch_chunks:
+                index = chunk["chunk_index"]
+                if 0 <= index < chunk_count and slots[index] is None:
+                    slots[index] = chunk
+                else:
+                    overflow.append(chunk)
             
             if next_offset is None:
                 break
                 
             offset = next_offset
         
-        # Transform points to response format
-        chunks = []
-        for point in points:
-            chunks.append({
-                "id": str(point.id),
-                "chunk_index": point.payload.get("chunk_index", 0),
-                "text": point.payload.get("text", ""),
-                "metadata": point.payload.get("metadata", {}),
-            })
-        
-        # Sort by chunk_index
-        chunks.sort(key=lambda x: x["chunk_index"])
+        chunks = [chunk for chunk in slots if chunk is not None]
+        if overflow:
+            chunks.extend(overflow)
+            chunks.sort(key=lambda x: x["chunk_index"])
         
         logger.info(
             "Retrieved %d chunks for document %s (user: %s)",
@@ -388,7 +472,6 @@ async def get_document(
         document = await kb_service.get_document(document_id)
 
         # Check ownership (admins can view any document)
-        from app.core.constants import UserRole
         is_admin = current_user.role in [UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value]
         
         if not is_admin and document.user_id != current_user.id:
@@ -445,7 +528,6 @@ async def delete_document(
         document = await kb_service.get_document(document_id)
 
         # Check ownership (admins can delete any document)
-        from app.core.constants import UserRole
         is_admin = current_user.role in [UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value]
         
         if not is_admin and document.user_id != current_user.id:
@@ -688,18 +770,19 @@ async def create_qdrant_snapshot(
         if qdrant.api_key:
             headers["api-key"] = str(qdrant.api_key)
         
+        http_client = get_qdrant_http_client()
+        
         async def generate():
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                async with client.stream("GET", snapshot_url, headers=headers) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        raise HTTPException(
-                            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            detail=f"Failed to download snapshot from Qdrant: {response.status_code} - {error_text.decode()}"
-                        )
-                    
-                    async for chunk in response.aiter_bytes():
-                        yield chunk
+            async with http_client.stream("GET", snapshot_url, headers=headers) as response:
+                if response.status_code != 200:
+                    error_text = await response.aread()
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=f"Failed to download snapshot from Qdrant: {response.status_code} - {error_text.decode()}"
+                    )
+                
+                async for chunk in response.aiter_bytes():
+                    yield chunk
         
         return StreamingResponse(
             generate(),
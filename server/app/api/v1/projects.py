@@ -3,73 +3,110 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.deps import client_errors_as_bad_request
+from app.cache.response_cache import cache_response, invalidates_response_cache
 from app.db.session import get_db
+from app.schemas.common import PaginatedResponse
 from app.schemas.project import Project, ProjectCreate, ProjectUpdate
 from app.services.project_service import ProjectService
-from app.core.exceptions import ResourceNotFoundError
+from app.utils.pagination import encode_cursor
+from app.utils.responses import adapter_response, entity_etag
 
-router = APIRouter(prefix="/projects", tags=["Projects"])
+router = APIRouter(
+    prefix="/projects",
+    tags=["Projects"],
+    dependencies=[Depends(client_errors_as_bad_request)],
+)
+
+# Prebuilt validators for ORM projects; a whole page validates and serializes in one call
+_PROJECT_ADAPTER = TypeAdapter(Project)
+_PROJECT_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[Project])
+
+
+async def get_project_service(db: Annotated[AsyncSession, Depends(get_db)]) -> ProjectService:
+    """Dependency to get a project service bound to the request's database session."""
+    return ProjectService(db)
 
 
 @router.post("", response_model=Project, status_code=status.HTTP_201_CREATED)
+@invalidates_response_cache("projects")
 async def create_project(
     project_data: ProjectCreate,
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> Project:
+    service: Annotated[ProjectService, Depends(get_project_service)],
+) -> Response:
     """Create a new project."""
-    service = ProjectService(db)
-    return await service.create_project(project_data)
+    project = await service.create_project(project_data)
+    return adapter_response(_PROJECT_ADAPTER, project, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("", response_model=list[Project])
+@router.get("", response_model=PaginatedResponse[Project])
+@cache_response("projects", ttl_seconds=30)
 async def list_projects(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[ProjectService, Depends(get_project_service)],
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
-) -> list[Project]:
-    """List projects."""
-    service = ProjectService(db)
-    return await service.list_projects(skip=skip, limit=limit)
+    cursor: Annotated[str | None, Query()] = None,
+) -> Response:
+    """List projects newest first.
+
+    When more projects exist, the cursor for the next page is returned as
+    next_cursor, as for users. ``skip`` is kept for backward compatibility. The
+    page is validated and serialized in a single batch, so FastAPI does not
+    re-validate it against the response model.
+    """
+    projects, has_more = await service.list_projects(skip=skip, limit=limit, cursor=cursor)
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(projects[-1].created_at, projects[-1].id)
+
+    return adapter_response(
+        _PROJECT_PAGE_ADAPTER,
+        {
+            "items": projects,
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        },
+    )
 
 
 @router.get("/{project_id}", response_model=Project)
+@cache_response("projects", ttl_seconds=300)
 async def get_project(
     project_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> Project:
-    """Get project by ID."""
-    service = ProjectService(db)
-    try:
-        return await service.get_project(project_id)
-    except ResourceNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    service: Annotated[ProjectService, Depends(get_project_service)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get project by ID, answering 304 if the client's ETag is still current."""
+    project = await service.get_project(project_id)
+    return adapter_response(
+        _PROJECT_ADAPTER, project, etag=entity_etag(project), if_none_match=if_none_match
+    )
 
 
 @router.put("/{project_id}", response_model=Project)
+@invalidates_response_cache("projects")
 async def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> Project:
+    service: Annotated[ProjectService, Depends(get_project_service)],
+) -> Response:
     """Update project."""
-    service = ProjectService(db)
-    try:
-        return await service.update_project(project_id, project_data)
-    except ResourceNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    project = await service.update_project(project_id, project_data)
+    return adapter_response(_PROJECT_ADAPTER, project)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@invalidates_response_cache("projects")
 async def delete_project(
     project_id: UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[ProjectService, Depends(get_project_service)],
 ) -> None:
     """Delete project."""
-    service = ProjectService(db)
-    try:
-        await service.delete_project(project_id)
-    except ResourceNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await service.delete_project(project_id)
@@ -1,24 +1,26 @@
 """User API endpoints."""
 
+from collections.abc import AsyncIterator
 from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user, require_admin
-from app.core.exceptions import (
-    AuthorizationError,
-    ResourceAlreadyExistsError,
-    ResourceNotFoundError,
-    ValidationError,
-)
+from app.api.deps import client_errors_as_bad_request, get_current_active_user, require_admin
+from app.cache.response_cache import cache_response, invalidates_response_cache
+from app.core.constants import UserRole
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.common import PaginatedResponse
 from app.schemas.user import (
     BulkDeleteUsersRequest,
     BulkUpdateUsersRequest,
+    SortOrder,
+    UserRoleName,
+    UserSortField,
     UserResponse,
     UserUpdate,
     UserCreate,
@@ -26,32 +28,72 @@ from app.schemas.user import (
     UserInviteResponse,
 )
 from app.services.user.user_service import UserService
+from app.utils.pagination import encode_cursor
+from app.utils.responses import adapter_response, entity_etag
+
+# Service errors (AppException subclasses) are turned into JSON error responses
+# by the application-wide handler in app.main, so endpoints let them propagate.
+# Validation and already-exists errors are reported as 400 on this router.
+
+router = APIRouter(
+    prefix="/users",
+    tags=["Users"],
+    dependencies=[Depends(client_errors_as_bad_request)],
+)
+
+# Prebuilt validators for ORM users; a whole page validates in one call
+_USER_ADAPTER = TypeAdapter(UserResponse)
+_USER_LIST_ADAPTER = TypeAdapter(list[UserResponse])
+_USER_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[UserResponse])
+
+# Role lookup by value without constructing the enum (and raising) per request
+_ROLE_BY_NAME: dict[str, UserRole] = {r.value: r for r in UserRole}
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
-router = APIRouter(prefix="/users", tags=["Users"])
+
+async def get_user_service(db: Annotated[AsyncSession, Depends(get_db)]) -> UserService:
+    """Dependency to get a user service bound to the request's database session."""
+    return UserService(db)
+
+
+async def _stream_users(users: AsyncIterator[User]) -> AsyncIterator[bytes]:
+    """Serialize users to newline-delimited JSON one row at a time."""
+    async for user in users:
+        validated = _USER_ADAPTER.validate_python(user, from_attributes=True)
+        yield _USER_ADAPTER.dump_json(validated) + b"\n"
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: Annotated[User, Depends(get_current_active_user)],
-) -> UserResponse:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Get current user information.
 
     Args:
         current_user: Current authenticated user
+        if_none_match: ETag of the client's copy, answered with 304 if still current
 
     Returns:
         User information
     """
-    return UserResponse.model_validate(current_user)
+    return adapter_response(
+        _USER_ADAPTER,
+        current_user,
+        etag=entity_etag(current_user),
+        if_none_match=if_none_match,
+    )
 
 
 @router.put("/me", response_model=UserResponse)
+@invalidates_response_cache("users")
 async def update_current_user_profile(
     user_data: UserUpdate,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> UserResponse:
+    user_service: Annotated[UserService, Depends(get_user_service)],
+) -> Response:
     """
     Update current user profile.
 
@@ -60,78 +102,71 @@ async def update_current_user_profile(
     Args:
         user_data: User update data
         current_user: Current authenticated user
-        db: Database session
+        user_service: User service bound to the request's database session
 
     Returns:
         Updated user information
 
     Raises:
-        HTTPException: 400 if validation fails or email already exists
+        ResourceAlreadyExistsError: 400 if email already exists
+        ValidationError: 400 if validation fails
+        AuthorizationError: 403 if insufficient permissions
     """
-    user_service = UserService(db)
-
-    try:
-        updated_user = await user_service.update_user(
-            user_id=current_user.id,
-            user_data=user_data,
-            current_user=current_user,
-        )
-        return UserResponse.model_validate(updated_user)
-    except ResourceAlreadyExistsError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
+    updated_user = await user_service.update_user(
+        user_id=current_user.id,
+        user_data=user_data,
+        current_user=current_user,
+    )
+    return adapter_response(_USER_ADAPTER, updated_user)
 
 
 @router.get("", response_model=PaginatedResponse[UserResponse])
+@cache_response("users", ttl_seconds=30)
 async def list_users(
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[Optional[str], Query()] = None,
     search: Annotated[Optional[str], Query()] = None,
-    role: Annotated[Optional[str], Query()] = None,
+    role: Annotated[Optional[UserRoleName], Query()] = None,
     is_active: Annotated[Optional[bool], Query()] = None,
-    sort_by: Annotated[Optional[str], Query()] = None,
-    sort_order: Annotated[Optional[str], Query()] = "asc",
-) -> PaginatedResponse[UserResponse]:
+    sort_by: Annotated[Optional[UserSortField], Query()] = None,
+    sort_order: Annotated[SortOrder, Query()] = "asc",
+    include_total: Annotated[bool, Query()] = False,
+    accept: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     List all users with pagination, search, filter, and sort (admin only).
 
     Only administrators can access this endpoint to view all users in the system.
+    Clients sending ``Accept: application/x-ndjson`` get the page streamed as one
+    JSON user per line, without pagination metadata.
 
     Args:
-        skip: Number of records to skip (default: 0)
+        skip: Number of records to skip (default: 0, deprecated in favour of cursor)
         limit: Maximum number of records to return (default: 20, max: 100)
+        cursor: Keyset cursor from a previous page's next_cursor (optional)
         search: Search term (searches email, first_name, and last_name) (optional)
-        role: Filter by role ('admin' or 'user') (optional)
+        role: Filter by role ('user', 'admin' or 'super_admin') (optional)
         is_active: Filter by active status (optional)
         sort_by: Column to sort by ('email', 'created_at', 'role', etc.) (optional)
         sort_order: Sort direction ('asc' or 'desc') (default: 'asc')
+        include_total: Whether to compute the exact total (extra COUNT query) (default: False)
+        accept: Accept header, selects NDJSON streaming when it asks for it
         current_user: Current authenticated admin user
-        db: Database session
+        user_service: User service bound to the request's database session
 
     Returns:
-        Paginated list of users with total count
+        Paginated list of users with has_more, the total count when requested and,
+        for the default ordering, a next_cursor for fetching the following page
 
     Raises:
         HTTPException: 403 if user is not an admin
+        ValidationError: 400 if the cursor is invalid
     """
-    user_service = UserService(db)
-
-    try:
-        users, total = await user_service.list_users(
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        users_iter = user_service.stream_users(
             skip=skip,
             limit=limit,
             search=search,
@@ -139,28 +174,50 @@ async def list_users(
             is_active=is_active,
             sort_by=sort_by,
             sort_order=sort_order,
-            current_user=current_user,
+            cursor=cursor,
         )
-
-        return PaginatedResponse(
-            items=[UserResponse.model_validate(user) for user in users],
-            total=total,
-            skip=skip,
-            limit=limit,
-        )
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
+        return StreamingResponse(_stream_users(users_iter), media_type=NDJSON_MEDIA_TYPE)
+
+    users, total, has_more = await user_service.list_users(
+        skip=skip,
+        limit=limit,
+        search=search,
+        role=role,
+        is_active=is_active,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        current_user=current_user,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+    next_cursor = None
+    if has_more and not sort_by:
+        next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+
+    # Serialize the page once here; returning a response skips the
+    # response_model pass FastAPI would otherwise run over every item
+    return adapter_response(
+        _USER_PAGE_ADAPTER,
+        {
+            "items": users,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        },
+    )
 
 
 @router.get("/{user_id}", response_model=UserResponse)
+@cache_response("users", ttl_seconds=300)
 async def get_user_by_id(
     user_id: UUID,
     _current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> UserResponse:
+    user_service: Annotated[UserService, Depends(get_user_service)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Get user by ID (admin only).
 
@@ -169,33 +226,57 @@ async def get_user_by_id(
     Args:
         user_id: User UUID
         _current_user: Current authenticated admin user (used for authorization)
-        db: Database session
+        user_service: User service bound to the request's database session
+        if_none_match: ETag of the client's copy, answered with 304 if still current
 
     Returns:
         User information
 
     Raises:
         HTTPException: 403 if user is not an admin
-        HTTPException: 404 if user not found
+        ResourceNotFoundError: 404 if user not found
+    """
+    user = await user_service.get_user(user_id)
+    return adapter_response(
+        _USER_ADAPTER, user, etag=entity_etag(user), if_none_match=if_none_match
+    )
+
+
+@router.head("/{user_id}")
+async def check_user_exists(
+    user_id: UUID,
+    _current_user: Annotated[User, Depends(require_admin())],
+    user_service: Annotated[UserService, Depends(get_user_service)],
+) -> Response:
+    """
+    Check whether a user exists (admin only).
+
+    Lets clients probe for a user without fetching and serializing it.
+
+    Args:
+        user_id: User UUID
+        _current_user: Current authenticated admin user (used for authorization)
+        user_service: User service bound to the request's database session
+
+    Returns:
+        Empty 200 if the user exists, empty 404 otherwise
+
+    Raises:
+        HTTPException: 403 if user is not an admin
     """
-    user_service = UserService(db)
+    if await user_service.user_exists(user_id):
+        return Response(status_code=status.HTTP_200_OK)
+    return Response(status_code=status.HTTP_404_NOT_FOUND)
 
-    try:
-        user = await user_service.get_user(user_id)
-        return UserResponse.model_validate(user)
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
 
 @router.post("", response_model=UserResponse)
+@invalidates_response_cache("users")
 async def create_user(
     user_data: UserCreate,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
     role: Annotated[Optional[str], Query()] = None,
-) -> UserResponse:
+) -> Response:
     """
     Create a new user (admin only).
     
@@ -203,51 +284,22 @@ async def create_user(
         user_data: User creation data (email, password, first_name, last_name, phone_number)
         role: User role ('admin' or 'user', default: 'user')
         current_user: Current authenticated admin user
-        db: Database session
+        user_service: User service bound to the request's database session
         
     Returns:
         Created user information
     """
-    from app.core.constants import UserRole
-    
-    try:
-        user_service = UserService(db)
-        # Parse role, default to USER if not provided or invalid
-        user_role = UserRole.USER
-        if role:
-            try:
-                user_role = UserRole(role)
-            except ValueError:
-                user_role = UserRole.USER
-        
-        user = await user_service.create_user(user_data, role=user_role, created_by=current_user)
-        return UserResponse.model_validate(user)
-    except ResourceAlreadyExistsError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        ) from e
+    # Parse role, default to USER if not provided or invalid
+    user_role = _ROLE_BY_NAME.get(role or "", UserRole.USER)
+
+    user = await user_service.create_user(user_data, role=user_role, created_by=current_user)
+    return adapter_response(_USER_ADAPTER, user)
 
 @router.post("/invite", response_model=UserInviteResponse, status_code=status.HTTP_201_CREATED)
 async def invite_user(
     invite_data: UserInviteRequest,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
 ) -> UserInviteResponse:
     """
     Invite a new user by email (admin only).
@@ -258,121 +310,62 @@ async def invite_user(
     Args:
         invite_data: Invitation data (email, role, optional description)
         current_user: Current authenticated admin user
-        db: Database session
+        user_service: User service bound to the request's database session
         
     Returns:
         Invitation details including token and link
         
     Raises:
-        HTTPException: 400 if user already exists
-        HTTPException: 403 if insufficient permissions
+        HTTPException: 400 if the role is invalid
+        ResourceAlreadyExistsError: 400 if user already exists
+        AuthorizationError: 403 if insufficient permissions
     """
-    from app.core.constants import UserRole
-    
-    try:
-        user_service = UserService(db)
-        
-        # Parse role - handle both UserRole enum and string
-        if isinstance(invite_data.role, UserRole):
-            user_role = invite_data.role
-        else:
-            try:
-                user_role = UserRole(invite_data.role.value if hasattr(invite_data.role, 'value') else str(invite_data.role))
-            except (ValueError, AttributeError):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid role: {invite_data.role}"
-                )
-        
-        invitation = await user_service.invite_user(
-            email=invite_data.email,
-            role=user_role,
-            invited_by=current_user,
-            description=invite_data.description,
-        )
-        
-        return UserInviteResponse(**invitation)
-        
-    except ResourceAlreadyExistsError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create invitation: {str(e)}",
-        ) from e
+    # Parse role - handle both UserRole enum and string
+    if isinstance(invite_data.role, UserRole):
+        user_role = invite_data.role
+    else:
+        user_role = _ROLE_BY_NAME.get(str(getattr(invite_data.role, "value", invite_data.role)))
+        if user_role is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid role: {invite_data.role}"
+            )
+
+    invitation = await user_service.invite_user(
+        email=invite_data.email,
+        role=user_role,
+        invited_by=current_user,
+        description=invite_data.description,
+    )
+
+    return UserInviteResponse(**invitation)
 
 @router.post("/{user_id}/deactivate", status_code=status.HTTP_204_NO_CONTENT)
+@invalidates_response_cache("users")
 async def deactivate_user(
     user_id: UUID,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
 ) -> None:
-    try:
-        user_service = UserService(db)
-        await user_service.deactivate_user(user_id, current_user)
-        return None
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        ) from e
+    await user_service.deactivate_user(user_id, current_user)
 
 @router.post("/{user_id}/activate", status_code=status.HTTP_204_NO_CONTENT)
+@invalidates_response_cache("users")
 async def activate_user(
     user_id: UUID,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
 ) -> None:
-    try:
-        user_service = UserService(db)
-        await user_service.activate_user(user_id, current_user)
-        return None
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
+    await user_service.activate_user(user_id, current_user)
 
 
 @router.post("/bulk-update-status", response_model=list[UserResponse])
+@invalidates_response_cache("users")
 async def bulk_update_user_status(
     request: BulkUpdateUsersRequest,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[UserResponse]:
+    user_service: Annotated[UserService, Depends(get_user_service)],
+) -> Response:
     """
     Bulk update user active status (admin only).
 
@@ -381,48 +374,31 @@ async def bulk_update_user_status(
     Args:
         request: Bulk update request with user IDs and new status
         current_user: Current authenticated admin user
-        db: Database session
+        user_service: User service bound to the request's database session
 
     Returns:
         List of updated users
 
     Raises:
-        HTTPException: 403 if user is not an admin
-        HTTPException: 404 if any user not found
-        HTTPException: 400 if validation fails
+        AuthorizationError: 403 if insufficient permissions
+        ResourceNotFoundError: 404 if any user not found
+        ValidationError: 400 if validation fails
     """
-    user_service = UserService(db)
-
-    try:
-        updated_users = await user_service.bulk_update_user_status(
-            user_ids=request.user_ids,
-            is_active=request.is_active,
-            current_user=current_user,
-        )
-        return [UserResponse.model_validate(user) for user in updated_users]
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e 
+    updated_users = await user_service.bulk_update_user_status(
+        user_ids=request.user_ids,
+        is_active=request.is_active,
+        current_user=current_user,
+    )
+    return adapter_response(_USER_LIST_ADAPTER, updated_users)
 
 @router.put("/{user_id}", response_model=UserResponse)
+@invalidates_response_cache("users")
 async def update_user_by_id(
     user_id: UUID,
     user_data: UserUpdate,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> UserResponse:
+    user_service: Annotated[UserService, Depends(get_user_service)],
+) -> Response:
     """
     Update user by ID (admin only).
 
@@ -432,52 +408,31 @@ async def update_user_by_id(
         user_id: User UUID to update
         user_data: User update data
         current_user: Current authenticated admin user
-        db: Database session
+        user_service: User service bound to the request's database session
 
     Returns:
         Updated user information
 
     Raises:
-        HTTPException: 403 if user is not an admin
-        HTTPException: 404 if user not found
-        HTTPException: 400 if validation fails or email already exists
+        AuthorizationError: 403 if insufficient permissions
+        ResourceNotFoundError: 404 if user not found
+        ResourceAlreadyExistsError: 400 if email already exists
+        ValidationError: 400 if validation fails
     """
-    user_service = UserService(db)
-
-    try:
-        updated_user = await user_service.update_user(
-            user_id=user_id,
-            user_data=user_data,
-            current_user=current_user,
-        )
-        return UserResponse.model_validate(updated_user)
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except ResourceAlreadyExistsError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
+    updated_user = await user_service.update_user(
+        user_id=user_id,
+        user_data=user_data,
+        current_user=current_user,
+    )
+    return adapter_response(_USER_ADAPTER, updated_user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@invalidates_response_cache("users")
 async def delete_user(
     user_id: UUID,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
 ) -> None:
     """
     Delete user by ID (admin only).
@@ -487,42 +442,25 @@ async def delete_user(
     Args:
         user_id: User UUID to delete
         current_user: Current authenticated admin user
-        db: Database session
+        user_service: User service bound to the request's database session
 
     Raises:
-        HTTPException: 403 if user is not an admin or trying to delete themselves
-        HTTPException: 404 if user not found
-        HTTPException: 400 if validation fails
+        AuthorizationError: 403 if insufficient permissions or deleting themselves
+        ResourceNotFoundError: 404 if user not found
+        ValidationError: 400 if validation fails
     """
-    user_service = UserService(db)
-
-    try:
-        await user_service.delete_user(
-            user_id=user_id,
-            current_user=current_user,
-        )
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
+    await user_service.delete_user(
+        user_id=user_id,
+        current_user=current_user,
+    )
 
 
 @router.post("/bulk-delete", status_code=status.HTTP_200_OK)
+@invalidates_response_cache("users")
 async def bulk_delete_users(
     request: BulkDeleteUsersRequest,
     current_user: Annotated[User, Depends(require_admin())],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
 ) -> dict[str, list[str]]:
     """
     Bulk delete users (admin only).
@@ -532,36 +470,18 @@ async def bulk_delete_users(
     Args:
         request: Bulk delete request with user IDs
         current_user: Current authenticated admin user
-        db: Database session
+        user_service: User service bound to the request's database session
 
     Returns:
         Dictionary with list of deleted user IDs
 
     Raises:
-        HTTPException: 403 if user is not an admin
-        HTTPException: 404 if any user not found
-        HTTPException: 400 if validation fails
+        AuthorizationError: 403 if insufficient permissions
+        ResourceNotFoundError: 404 if any user not found
+        ValidationError: 400 if validation fails
     """
-    user_service = UserService(db)
-
-    try:
-        deleted_user_ids = await user_service.bulk_delete_users(
-            user_ids=request.user_ids,
-            current_user=current_user,
-        )
-        return {"deleted_user_ids": [str(user_id) for user_id in deleted_user_ids]}
-    except ResourceNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
-    except AuthorizationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        ) from e
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
+    deleted_user_ids = await user_service.bulk_delete_users(
+        user_ids=request.user_ids,
+        current_user=current_user,
+    )
+    return {"deleted_user_ids": [str(user_id) for user_id in deleted_user_ids]}
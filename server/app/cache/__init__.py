@@ -8,6 +8,7 @@ from app.cache.cache_service import (
     generate_user_cache_key,
     get_cache_service,
 )
+from app.cache.memory_cache import TTLCache
 from app.cache.rate_limiter import (
     AgentQueryRateLimiter,
     IPRateLimiter,
@@ -19,6 +20,11 @@ from app.cache.rate_limiter import (
     get_user_rate_limiter,
 )
 from app.cache.redis_client import RedisClient, get_redis_client, redis_client
+from app.cache.response_cache import (
+    cache_response,
+    invalidate_response_cache,
+    invalidates_response_cache,
+)
 
 __all__ = [
     # Redis client
@@ -32,6 +38,12 @@ __all__ = [
     "generate_query_cache_key",
     "generate_user_cache_key",
     "generate_session_cache_key",
+    # In-process cache
+    "TTLCache",
+    # Response cache
+    "cache_response",
+    "invalidate_response_cache",
+    "invalidates_response_cache",
     # Rate limiting
     "RateLimiter",
     "UserRateLimiter",
@@ -1,18 +1,51 @@
 """Cache service for Redis operations."""
 
+import functools
 import hashlib
-import json
 import logging
 from typing import Any, Optional
 
+import orjson
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
+from app.cache.memory_cache import TTLCache
 from app.cache.redis_client import get_redis_client
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# stdlib json accepted non-string dict keys, keep that working
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes."""
+    return orjson.dumps(value, option=_ORJSON_OPTIONS)
+
+
+# Immutable scalars are serialized through a small memo so repeatedly cached
+# values (tokens, ids, flags) skip re-encoding. Containers are not memoized:
+# they are unhashable, and keying on identity would return stale bytes after
+# a mutation.
+_MEMOIZABLE_TYPES = frozenset({str, int, float, bool})
+_memoized_dumps = functools.lru_cache(maxsize=1024, typed=True)(_dumps)
+
+# In-process read cache behind the shared CacheService. Values are kept for a
+# fraction of a second so repeated reads within a request burst skip Redis;
+# writes through this process invalidate them immediately, writes from other
+# processes become visible once the entry expires.
+_local_cache = TTLCache(maxsize=settings.CACHE_LOCAL_SIZE, ttl=settings.CACHE_LOCAL_TTL)
+_MISSING = object()
+
+# Keys examined per SCAN call in delete_pattern (Redis defaults to 10)
+SCAN_BATCH_SIZE = 1000
+
+# Unlinks a batch of keys in one EVALSHA; returns the number removed
+_UNLINK_SCRIPT = """
+return redis.call('UNLINK', unpack(KEYS))
+"""
+
 
 class CacheService:
     """Service for cache operations with Redis."""
@@ -25,18 +58,54 @@ class CacheService:
             redis_client: Redis client instance
         """
         self._redis = redis_client
+        # Runs via EVALSHA, reloading the script automatically on NOSCRIPT
+        self._unlink = redis_client.register_script(_UNLINK_SCRIPT)
         self._default_ttl = settings.CACHE_TTL_SECONDS
+        self._local = _local_cache if settings.CACHE_LOCAL_SIZE else None
+
+    @property
+    def client(self) -> Redis:
+        """
+        Get the Redis client this service was created with.
+
+        Returns:
+            Redis: The Redis client instance
+        """
+        return self._redis
+
+    def _serialize(self, value: Any) -> bytes:
+        """
+        Serialize a value, reusing the encoding of recently cached scalars.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Serialized bytes
+        """
+        if type(value) in _MEMOIZABLE_TYPES:
+            return _memoized_dumps(value)
+        return _dumps(value)
 
     async def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
 
+        Values read recently by this process may be returned from the local
+        cache; they are shared between callers and must not be mutated.
+
         Args:
             key: Cache key
 
         Returns:
             Cached value or None if not found
         """
+        if self._local is not None:
+            local_value = self._local.get(key, _MISSING)
+            if local_value is not _MISSING:
+                logger.debug("Local cache hit for key: %s", key)
+                return local_value
+
         try:
             value = await self._redis.get(key)
             if value is None:
@@ -44,11 +113,14 @@ class CacheService:
                 return None
 
             logger.debug("Cache hit for key: %s", key)
-            return json.loads(value)
+            loaded = orjson.loads(value)
+            if self._local is not None:
+                self._local.set(key, loaded)
+            return loaded
         except RedisError as e:
             logger.error("Redis error getting key %s: %s", key, e)
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("JSON decode error for key %s: %s", key, e)
             return None
         except Exception as e:
@@ -72,9 +144,10 @@ class CacheService:
         Returns:
             True if successful, False otherwise
         """
+        _local_cache.pop(key)
         try:
             ttl_seconds = ttl if ttl is not None else self._default_ttl
-            serialized_value = json.dumps(value)
+            serialized_value = self._serialize(value)
 
             result = await self._redis.setex(
                 key,
@@ -113,6 +186,7 @@ class CacheService:
         Returns:
             True if key was deleted, False otherwise
         """
+        _local_cache.pop(key)
         try:
             result = await self._redis.delete(key)
             if result > 0:
@@ -133,22 +207,34 @@ class CacheService:
         """
         Delete all keys matching a pattern.
 
+        Keys are scanned in large batches and each batch is UNLINKed as soon as
+        it arrives, so memory stays bounded by the batch size and Redis frees
+        the values in the background.
+
         Args:
             pattern: Key pattern (e.g., "user:*")
 
         Returns:
             Number of keys deleted
         """
+        # Matching local entries are not tracked by pattern, so drop them all
+        _local_cache.clear()
         try:
-            keys = []
-            async for key in self._redis.scan_iter(match=pattern):
-                keys.append(key)
+            deleted = 0
+            cursor = 0
+            while True:
+                cursor, keys = await self._redis.scan(
+                    cursor, match=pattern, count=SCAN_BATCH_SIZE
+                )
+                if keys:
+                    deleted += await self._unlink(keys=keys)
+                if cursor == 0:
+                    break
 
-            if not keys:
+            if not deleted:
                 logger.debug("No keys found matching pattern: %s", pattern)
                 return 0
 
-            deleted = await self._redis.delete(*keys)
             logger.debug(
                 "Deleted %d keys matching pattern: %s",
                 deleted,
@@ -228,6 +314,7 @@ class CacheService:
         Returns:
             New value after increment, None on error
         """
+        _local_cache.pop(key)
         try:
             result = await self._redis.incrby(key, amount)
             logger.debug("Incremented key %s by %d to %d", key, amount, result)
@@ -300,7 +387,9 @@ def generate_query_cache_key(query: str, user_id: str) -> str:
     Returns:
         Cache key for the query
     """
-    query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
+    # 64-bit digest: keys are already scoped per user, so collisions are
+    # negligible at any realistic number of cached queries per user
+    query_hash = hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
     return generate_cache_key("query_cache", user_id, query_hash)
 
 
@@ -330,12 +419,19 @@ def generate_session_cache_key(user_id: str) -> str:
     return generate_cache_key("session", user_id)
 
 
+# Services are stateless apart from their client, so one per client is shared
+_cache_service: Optional[CacheService] = None
+
+
 async def get_cache_service() -> CacheService:
     """
     Dependency injection function for FastAPI.
 
     Returns:
-        CacheService instance
+        Shared CacheService instance
     """
+    global _cache_service
     redis_client = await get_redis_client()
-    return CacheService(redis_client)
+    if _cache_service is None or _cache_service.client is not redis_client:
+        _cache_service = CacheService(redis_client)
+    return _cache_service
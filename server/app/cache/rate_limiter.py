@@ -1,4 +1,4 @@
-"""Rate limiting service using Redis sliding window algorithm."""
+"""Rate limiting service using Redis sliding window algorithms."""
 
 import logging
 import time
@@ -13,9 +13,59 @@ from app.core.exceptions import RateLimitError
 
 logger = logging.getLogger(__name__)
 
+_MICROSECONDS = 1_000_000
+
+# Atomically trims the window, counts it and records the request only if it is
+# allowed, so a check costs one round-trip and denied requests write nothing.
+# Scores and members are integer microseconds; two requests in the same
+# microsecond share a member and count once, which is acceptable.
+# KEYS[1] = key; ARGV = window_start_us, now_us, limit, window_seconds, member
+# Returns {allowed (0/1), count including this request if allowed}
+_SLIDING_LOG_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local count = redis.call('ZCARD', KEYS[1])
+if count >= tonumber(ARGV[3]) then
+    return {0, count}
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[5])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return {1, count + 1}
+"""
+
+# Sliding window counter: approximates the window as the current fixed-window
+# bucket plus the previous bucket weighted by how much of it still overlaps
+# the window. Two small counters per identifier instead of one ZSET member per
+# request. Denied requests are not counted.
+# KEYS[1] = current bucket, KEYS[2] = previous bucket
+# ARGV = previous bucket weight, limit, bucket ttl
+# Returns {allowed (0/1), weighted count including this request if allowed}
+_SLIDING_WINDOW_COUNTER_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local weighted = math.floor(previous * tonumber(ARGV[1])) + current
+if weighted >= tonumber(ARGV[2]) then
+    return {0, weighted}
+end
+if redis.call('INCR', KEYS[1]) == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return {1, weighted + 1}
+"""
+
+
+# Key prefixes are pre-encoded so per-request keys are a single bytes concat
+RATE_LIMIT_KEY_PREFIX = b"rate_limit:"
+USER_KEY_PREFIX = b"rate_limit:user:"
+IP_KEY_PREFIX = b"rate_limit:ip:"
+AGENT_QUERY_KEY_PREFIX = b"rate_limit:agent_query:"
+
 
 class RateLimiter:
-    """Rate limiter using Redis sliding window algorithm."""
+    """Rate limiter using Redis sliding window algorithms.
+
+    Checks use an approximate sliding window counter by default; pass
+    ``precise=True`` for the exact (per-request sorted set) sliding log.
+    """
 
     def __init__(self, redis_client: Redis) -> None:
         """
@@ -26,78 +76,122 @@ class RateLimiter:
         """
         self._redis = redis_client
         self._window_seconds = 3600  # 1 hour window
+        # Runs via EVALSHA, reloading the script automatically on NOSCRIPT
+        self._sliding_log = redis_client.register_script(_SLIDING_LOG_SCRIPT)
+        self._sliding_window_counter = redis_client.register_script(_SLIDING_WINDOW_COUNTER_SCRIPT)
+
+    @staticmethod
+    def _bucket_keys(key: bytes, bucket: int) -> tuple[bytes, bytes]:
+        """
+        Build the current and previous fixed-window bucket keys.
+
+        The base key is wrapped in a hash tag so both keys share a cluster slot.
+
+        Args:
+            key: Base rate limit key
+            bucket: Index of the current window bucket
+
+        Returns:
+            Tuple of (current_key, previous_key)
+        """
+        return b"{%s}:%d" % (key, bucket), b"{%s}:%d" % (key, bucket - 1)
 
     async def check_rate_limit(
         self,
         identifier: str,
         limit: int,
-        window_seconds: Optional[int] = None
+        window_seconds: Optional[int] = None,
+        precise: bool = False
     ) -> tuple[bool, int, int]:
         """
-        Check if request is within rate limit using sliding window.
+        Check if request is within rate limit using a sliding window.
+
+        By default requests are counted in fixed-window buckets, weighting the
+        previous bucket by its overlap with the window, so memory per identifier
+        is constant and counts are approximate. ``precise=True`` keeps one
+        sorted set member per request for an exact count.
 
         Args:
             identifier: Unique identifier (user_id, IP, etc.)
             limit: Maximum requests allowed in window
             window_seconds: Time window in seconds (default: 3600)
+            precise: Use the exact sliding log instead of the approximate counter
 
         Returns:
             Tuple of (is_allowed, current_count, remaining)
-
-        Raises:
-            RateLimitError: If rate limit is exceeded
         """
-        window = window_seconds if window_seconds else self._window_seconds
-        key = f"rate_limit:{identifier}"
-        current_time = time.time()
-        window_start = current_time - window
-
-        try:
-            # Use Redis pipeline for atomic operations
-            pipe = self._redis.pipeline()
-
-            # Remove old entries outside the window
-            pipe.zremrangebyscore(key, 0, window_start)
+        return await self.check_rate_limit_raw(
+            RATE_LIMIT_KEY_PREFIX + identifier.encode(),
+            limit,
+            window_seconds,
+            precise
+        )
 
-            # Count requests in current window
-            pipe.zcard(key)
+    async def check_rate_limit_raw(
+        self,
+        key: bytes,
+        limit: int,
+        window_seconds: Optional[int] = None,
+        precise: bool = False
+    ) -> tuple[bool, int, int]:
+        """
+        Check a rate limit by its full Redis key.
 
-            # Add current request with timestamp as score
-            pipe.zadd(key, {str(current_time): current_time})
+        Hot paths build the key from a pre-encoded prefix (e.g.
+        ``USER_KEY_PREFIX + user_id.encode()``) instead of formatting strings.
 
-            # Set expiration on the key
-            pipe.expire(key, window)
+        Args:
+            key: Full rate limit key, including the ``rate_limit:`` prefix
+            limit: Maximum requests allowed in window
+            window_seconds: Time window in seconds (default: 3600)
+            precise: Use the exact sliding log instead of the approximate counter
 
-            # Execute pipeline
-            results = await pipe.execute()
+        Returns:
+            Tuple of (is_allowed, current_count, remaining)
+        """
+        window = window_seconds if window_seconds else self._window_seconds
 
-            # Get count before adding current request
-            current_count = results[1]
+        try:
+            if precise:
+                # Trim, count and (if allowed) record the request in one script call
+                now_us = int(time.time() * _MICROSECONDS)
+                allowed, current_count = await self._sliding_log(
+                    keys=[key],
+                    args=[now_us - window * _MICROSECONDS, now_us, limit, window, now_us],
+                )
+            else:
+                current_time = time.time()
+                bucket = int(current_time // window)
+                previous_weight = (window - (current_time - bucket * window)) / window
+                allowed, current_count = await self._sliding_window_counter(
+                    keys=self._bucket_keys(key, bucket),
+                    args=[previous_weight, limit, window * 2],
+                )
 
             # Check if limit exceeded
-            if current_count >= limit:
+            if not allowed:
                 logger.warning(
                     "Rate limit exceeded for %s: %d/%d",
-                    identifier,
+                    key.decode(),
                     current_count,
                     limit
                 )
                 return False, current_count, 0
 
-            remaining = limit - current_count - 1
+            remaining = max(0, limit - current_count)
             logger.debug(
                 "Rate limit check passed for %s: %d/%d (remaining: %d)",
-                identifier,
-                current_count + 1,
+                key.decode(),
+                current_count,
                 limit,
                 remaining
             )
-            return True, current_count + 1, remaining
+            return True, current_count, remaining
 
         except RedisError as e:
             logger.error(
                 "Redis error checking rate limit for %s: %s",
-                identifier,
+                key.decode(),
                 e
             )
             # Fail open - allow request if Redis is down
@@ -105,7 +199,7 @@ class RateLimiter:
         except Exception as e:
             logger.error(
                 "Unexpected error checking rate limit for %s: %s",
-                identifier,
+                key.decode(),
                 e
             )
             # Fail open - allow request on unexpected errors
@@ -115,7 +209,8 @@ class RateLimiter:
         self,
         identifier: str,
         limit: int,
-        window_seconds: Optional[int] = None
+        window_seconds: Optional[int] = None,
+        precise: bool = False
     ) -> None:
         """
         Check rate limit and raise exception if exceeded.
@@ -124,14 +219,42 @@ class RateLimiter:
             identifier: Unique identifier (user_id, IP, etc.)
             limit: Maximum requests allowed in window
             window_seconds: Time window in seconds (default: 3600)
+            precise: Use the exact sliding log instead of the approximate counter
+
+        Raises:
+            RateLimitError: If rate limit is exceeded
+        """
+        await self.check_and_raise_raw(
+            RATE_LIMIT_KEY_PREFIX + identifier.encode(),
+            limit,
+            window_seconds,
+            precise
+        )
+
+    async def check_and_raise_raw(
+        self,
+        key: bytes,
+        limit: int,
+        window_seconds: Optional[int] = None,
+        precise: bool = False
+    ) -> None:
+        """
+        Check a rate limit by its full Redis key and raise if exceeded.
+
+        Args:
+            key: Full rate limit key, including the ``rate_limit:`` prefix
+            limit: Maximum requests allowed in window
+            window_seconds: Time window in seconds (default: 3600)
+            precise: Use the exact sliding log instead of the approximate counter
 
         Raises:
             RateLimitError: If rate limit is exceeded
         """
-        is_allowed, current, _ = await self.check_rate_limit(
-            identifier,
+        is_allowed, current, _ = await self.check_rate_limit_raw(
+            key,
             limit,
-            window_seconds
+            window_seconds,
+            precise
         )
 
         if not is_allowed:
@@ -143,7 +266,8 @@ class RateLimiter:
         self,
         identifier: str,
         limit: int,
-        window_seconds: Optional[int] = None
+        window_seconds: Optional[int] = None,
+        precise: bool = False
     ) -> int:
         """
         Get remaining requests in current window.
@@ -152,23 +276,32 @@ class RateLimiter:
             identifier: Unique identifier (user_id, IP, etc.)
             limit: Maximum requests allowed in window
             window_seconds: Time window in seconds (default: 3600)
+            precise: Read the exact sliding log instead of the approximate counter
 
         Returns:
             Number of remaining requests
         """
         window = window_seconds if window_seconds else self._window_seconds
-        key = f"rate_limit:{identifier}"
+        key = RATE_LIMIT_KEY_PREFIX + identifier.encode()
         current_time = time.time()
-        window_start = current_time - window
 
         try:
-            # Remove old entries and count current
-            pipe = self._redis.pipeline()
-            pipe.zremrangebyscore(key, 0, window_start)
-            pipe.zcard(key)
-            results = await pipe.execute()
+            if precise:
+                # Remove old entries and count current
+                pipe = self._redis.pipeline()
+                now_us = int(current_time * _MICROSECONDS)
+                pipe.zremrangebyscore(key, 0, now_us - window * _MICROSECONDS)
+                pipe.zcard(key)
+                results = await pipe.execute()
+                current_count = results[1]
+            else:
+                bucket = int(current_time // window)
+                previous_weight = (window - (current_time - bucket * window)) / window
+                current, previous = await self._redis.mget(
+                    self._bucket_keys(key, bucket)
+                )
+                current_count = int(int(previous or 0) * previous_weight) + int(current or 0)
 
-            current_count = results[1]
             remaining = max(0, limit - current_count)
 
             return remaining
@@ -192,16 +325,20 @@ class RateLimiter:
         """
         Reset rate limit for an identifier.
 
+        Clears the exact sliding log and the approximate counter buckets for
+        the default window.
+
         Args:
             identifier: Unique identifier to reset
 
         Returns:
             True if successful, False otherwise
         """
-        key = f"rate_limit:{identifier}"
+        key = RATE_LIMIT_KEY_PREFIX + identifier.encode()
+        bucket = int(time.time() // self._window_seconds)
 
         try:
-            result = await self._redis.delete(key)
+            result = await self._redis.delete(key, *self._bucket_keys(key, bucket))
             if result > 0:
                 logger.info("Reset rate limit for: %s", identifier)
                 return True
@@ -232,6 +369,7 @@ class UserRateLimiter:
         """
         self._limiter = rate_limiter
         self._limit = settings.RATE_LIMIT_PER_USER
+        self._prefix = USER_KEY_PREFIX
 
     async def check_user_limit(self, user_id: str) -> tuple[bool, int, int]:
         """
@@ -243,8 +381,9 @@ class UserRateLimiter:
         Returns:
             Tuple of (is_allowed, current_count, remaining)
         """
-        identifier = f"user:{user_id}"
-        return await self._limiter.check_rate_limit(identifier, self._limit)
+        return await self._limiter.check_rate_limit_raw(
+            self._prefix + user_id.encode(), self._limit
+        )
 
     async def check_and_raise(self, user_id: str) -> None:
         """
@@ -256,8 +395,7 @@ class UserRateLimiter:
         Raises:
             RateLimitError: If rate limit is exceeded
         """
-        identifier = f"user:{user_id}"
-        await self._limiter.check_and_raise(identifier, self._limit)
+        await self._limiter.check_and_raise_raw(self._prefix + user_id.encode(), self._limit)
 
 
 class IPRateLimiter:
@@ -272,6 +410,7 @@ class IPRateLimiter:
         """
         self._limiter = rate_limiter
         self._limit = settings.RATE_LIMIT_PER_IP
+        self._prefix = IP_KEY_PREFIX
 
     async def check_ip_limit(self, ip_address: str) -> tuple[bool, int, int]:
         """
@@ -283,8 +422,9 @@ class IPRateLimiter:
         Returns:
             Tuple of (is_allowed, current_count, remaining)
         """
-        identifier = f"ip:{ip_address}"
-        return await self._limiter.check_rate_limit(identifier, self._limit)
+        return await self._limiter.check_rate_limit_raw(
+            self._prefix + ip_address.encode(), self._limit
+        )
 
     async def check_and_raise(self, ip_address: str) -> None:
         """
@@ -296,8 +436,7 @@ class IPRateLimiter:
         Raises:
             RateLimitError: If rate limit is exceeded
         """
-        identifier = f"ip:{ip_address}"
-        await self._limiter.check_and_raise(identifier, self._limit)
+        await self._limiter.check_and_raise_raw(self._prefix + ip_address.encode(), self._limit)
 
 
 class AgentQueryRateLimiter:
@@ -312,6 +451,7 @@ class AgentQueryRateLimiter:
         """
         self._limiter = rate_limiter
         self._limit = settings.AGENT_QUERY_LIMIT
+        self._prefix = AGENT_QUERY_KEY_PREFIX
 
     async def check_query_limit(self, user_id: str) -> tuple[bool, int, int]:
         """
@@ -323,8 +463,10 @@ class AgentQueryRateLimiter:
         Returns:
             Tuple of (is_allowed, current_count, remaining)
         """
-        identifier = f"agent_query:{user_id}"
-        return await self._limiter.check_rate_limit(identifier, self._limit)
+        # Agent queries are expensive and low-limit, so count them exactly
+        return await self._limiter.check_rate_limit_raw(
+            self._prefix + user_id.encode(), self._limit, precise=True
+        )
 
     async def check_and_raise(self, user_id: str) -> None:
         """
@@ -336,8 +478,9 @@ class AgentQueryRateLimiter:
         Raises:
             RateLimitError: If rate limit is exceeded
         """
-        identifier = f"agent_query:{user_id}"
-        await self._limiter.check_and_raise(identifier, self._limit)
+        await self._limiter.check_and_raise_raw(
+            self._prefix + user_id.encode(), self._limit, precise=True
+        )
 
 
 async def get_rate_limiter() -> RateLimiter:
@@ -1,16 +1,27 @@
 """Redis client for caching and session management."""
 
 import logging
+import socket
 from typing import Optional
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
+from redis.utils import HIREDIS_AVAILABLE
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Detect dead Redis connections after ~90s idle instead of the OS default of
+# hours. The TCP_KEEP* constants are Linux-specific; elsewhere the OS
+# keepalive defaults apply.
+_KEEPALIVE_OPTIONS: dict[int, int] = (
+    {socket.TCP_KEEPIDLE: 60, socket.TCP_KEEPINTVL: 10, socket.TCP_KEEPCNT: 3}
+    if hasattr(socket, "TCP_KEEPIDLE")
+    else {}
+)
+
 
 class RedisClient:
     """Async Redis client wrapper with connection management and health checks."""
@@ -20,6 +31,9 @@ class RedisClient:
         self._client: Optional[Redis] = None
         self._url = settings.REDIS_URL
         self._max_connections = settings.REDIS_MAX_CONNECTIONS
+        self._socket_connect_timeout = settings.REDIS_SOCKET_CONNECT_TIMEOUT
+        self._socket_timeout = settings.REDIS_SOCKET_TIMEOUT
+        self._health_check_interval = settings.REDIS_HEALTH_CHECK_INTERVAL
 
     async def connect(self) -> None:
         """Establish connection to Redis server."""
@@ -28,18 +42,38 @@ class RedisClient:
             return
 
         try:
+            # Replies stay bytes: cached values are parsed straight from bytes
+            # (orjson), and counters come back as ints. str arguments are
+            # still encoded with the default UTF-8.
+            # redis-py always sets TCP_NODELAY, so small commands are not
+            # delayed by Nagle's algorithm.
             self._client = await redis.from_url(
                 self._url,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
                 max_connections=self._max_connections,
+                socket_connect_timeout=self._socket_connect_timeout,
+                socket_timeout=self._socket_timeout,
+                socket_keepalive=True,
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                health_check_interval=self._health_check_interval,
+                retry_on_timeout=True,
             )
             logger.info(f"Connected to Redis at {self._url}")
+            # redis-py picks the C parser automatically when hiredis is installed
+            if HIREDIS_AVAILABLE:
+                logger.info("Redis reply parser: hiredis")
+            else:
+                logger.warning(
+                    "Redis reply parser: pure Python (install redis[hiredis] for the C parser)"
+                )
 
             # Test connection
             await self._client.ping()
             logger.info("Redis connection verified with PING")
 
+            global _redis
+            _redis = self._client
+
         except RedisConnectionError as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
@@ -57,6 +91,9 @@ class RedisClient:
             await self._client.close()
             await self._client.connection_pool.disconnect()
             self._client = None
+
+            global _redis
+            _redis = None
             logger.info("Disconnected from Redis")
         except Exception as e:
             logger.error(f"Error disconnecting from Redis: {e}")
@@ -118,6 +155,10 @@ class RedisClient:
 # Global Redis client instance
 redis_client = RedisClient()
 
+# Connected client, bound by connect() so the per-request dependency is a plain
+# global read
+_redis: Optional[Redis] = None
+
 
 async def get_redis_client() -> Redis:
     """
@@ -129,4 +170,6 @@ async def get_redis_client() -> Redis:
     Raises:
         RuntimeError: If Redis client is not connected
     """
-    return redis_client.client
+    if _redis is None:
+        raise RuntimeError("Redis client not connected. Call connect() first.")
+    return _redis
@@ -0,0 +1,193 @@
+"""Redis-backed response caching for read-only API endpoints."""
+
+import functools
+import hashlib
+import logging
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+from uuid import UUID
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.cache_service import CacheService, generate_cache_key, get_cache_service
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+RESPONSE_CACHE_PREFIX = "response_cache"
+
+# Endpoint arguments of these types identify the response and go into the key
+_KEY_ARG_TYPES = (str, int, float, bool, UUID, Enum, type(None))
+
+
+async def _get_cache() -> Optional[CacheService]:
+    """Get a cache service, or None if Redis is unavailable."""
+    try:
+        return await get_cache_service()
+    except Exception as e:
+        logger.debug("Response cache unavailable: %s", e)
+        return None
+
+
+def _generation_key(namespace: str) -> str:
+    """Key of the counter that is bumped to invalidate a namespace."""
+    return generate_cache_key(namespace, "generation", prefix=RESPONSE_CACHE_PREFIX)
+
+
+def build_response_cache_key(
+    namespace: str, generation: int, endpoint: str, kwargs: dict[str, Any]
+) -> str:
+    """
+    Build a deterministic cache key for an endpoint call.
+
+    The key is scoped by namespace, the namespace's current generation, endpoint
+    name, the calling user (any User argument) and a hash of the sorted scalar
+    arguments (path/query params).
+
+    Args:
+        namespace: Cache namespace used for invalidation (e.g. "users")
+        generation: Current generation of the namespace
+        endpoint: Endpoint function name
+        kwargs: Endpoint keyword arguments
+
+    Returns:
+        Cache key
+    """
+    user_id = "anonymous"
+    params = []
+    for name, value in sorted(kwargs.items()):
+        if isinstance(value, User):
+            user_id = str(value.id)
+        elif isinstance(value, _KEY_ARG_TYPES):
+            params.append(f"{name}={value}")
+
+    params_hash = hashlib.sha256("&".join(params).encode()).hexdigest()[:16]
+    return generate_cache_key(
+        namespace, generation, endpoint, user_id, params_hash, prefix=RESPONSE_CACHE_PREFIX
+    )
+
+
+def cache_response(namespace: str, ttl_seconds: int) -> Callable[[F], F]:
+    """
+    Cache an endpoint's JSON response in Redis.
+
+    Cache hits return the stored JSON-compatible data, which FastAPI validates
+    against the endpoint's response_model as usual. Headers the endpoint sets on
+    an injected ``Response`` are cached and replayed too. Endpoints that return
+    a pre-serialized ``Response`` have its body and headers cached verbatim;
+    streaming and non-200 responses are passed through uncached. Redis errors
+    fall through to the endpoint.
+
+    Args:
+        namespace: Cache namespace, invalidated by ``invalidate_response_cache``
+        ttl_seconds: Time to live for cached responses
+
+    Returns:
+        Decorator for async endpoint functions
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache = await _get_cache()
+            if cache is None:
+                return await func(*args, **kwargs)
+
+            generation = await cache.get(_generation_key(namespace)) or 0
+            key = build_response_cache_key(namespace, generation, func.__name__, kwargs)
+            response = next((v for v in kwargs.values() if isinstance(v, Response)), None)
+
+            cached = await cache.get(key)
+            if cached is not None:
+                if "raw" in cached:
+                    return Response(
+                        content=cached["raw"],
+                        media_type=cached["media_type"],
+                        headers=cached["headers"],
+                    )
+                if response is not None:
+                    response.headers.update(cached["headers"])
+                return cached["body"]
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, StreamingResponse) or (
+                isinstance(result, Response) and result.status_code != 200
+            ):
+                # Streamed bodies are not buffered and non-200 responses (e.g.
+                # 304 Not Modified) are only valid for this request
+                return result
+            if isinstance(result, Response):
+                entry = {
+                    "raw": bytes(result.body).decode(),
+                    "media_type": result.media_type,
+                    "headers": {
+                        k: v
+                        for k, v in result.headers.items()
+                        if k not in ("content-length", "content-type")
+                    },
+                }
+            else:
+                entry = {
+                    "body": jsonable_encoder(result),
+                    "headers": dict(response.headers) if response is not None else {},
+                }
+            await cache.set(key, entry, ttl=ttl_seconds)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+async def invalidate_response_cache(*namespaces: str) -> None:
+    """
+    Drop all cached responses in the given namespaces.
+
+    Each namespace's generation counter is incremented, so later reads build
+    keys that miss. Entries of older generations are left to expire by TTL.
+
+    Args:
+        *namespaces: Cache namespaces to invalidate
+    """
+    cache = await _get_cache()
+    if cache is None:
+        return
+    for namespace in namespaces:
+        await cache.increment(_generation_key(namespace))
+
+
+def invalidates_response_cache(*namespaces: str) -> Callable[[F], F]:
+    """
+    Invalidate cached responses after a write endpoint succeeds.
+
+    The request's database session (if any, injected directly or via a service's
+    ``db`` attribute) is committed first so that a concurrent read cannot
+    repopulate the cache with pre-write data.
+
+    Args:
+        *namespaces: Cache namespaces to invalidate
+
+    Returns:
+        Decorator for async endpoint functions
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await func(*args, **kwargs)
+            for value in kwargs.values():
+                # Sessions are injected directly or held by an injected service
+                session = value if isinstance(value, AsyncSession) else getattr(value, "db", None)
+                if isinstance(session, AsyncSession):
+                    await session.commit()
+            await invalidate_response_cache(*namespaces)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
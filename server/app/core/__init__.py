@@ -37,8 +37,10 @@ from app.core.security import (
     create_refresh_token,
     decode_token,
     get_password_hash,
+    get_password_hash_async,
     validate_password_strength,
     verify_password,
+    verify_password_async,
 )
 
 __all__ = [
@@ -77,6 +79,8 @@ __all__ = [
     # Security
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
@@ -1,11 +1,22 @@
 """Custom exception classes for the application."""
 
+from functools import lru_cache
 from typing import Any, Optional
 
 
+@lru_cache(maxsize=64)
+def _resource_message(resource: str, suffix: str) -> str:
+    """Build (once per resource) messages like "User not found"."""
+    return f"{resource} {suffix}"
+
+
 class AppException(Exception):
     """Base exception class for all application exceptions."""
 
+    # Attributes live in slots, so raising doesn't allocate an instance __dict__;
+    # subclasses declare empty __slots__ to keep it that way
+    __slots__ = ("message", "status_code", "details")
+
     def __init__(
         self,
         message: str,
@@ -29,6 +40,8 @@ class AppException(Exception):
 class AuthenticationError(AppException):
     """Exception raised for authentication failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -41,6 +54,8 @@ class AuthenticationError(AppException):
 class AuthorizationError(AppException):
     """Exception raised for authorization failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Insufficient permissions",
@@ -53,6 +68,8 @@ class AuthorizationError(AppException):
 class ValidationError(AppException):
     """Exception raised for validation failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Validation failed",
@@ -65,6 +82,8 @@ class ValidationError(AppException):
 class ResourceNotFoundError(AppException):
     """Exception raised when a requested resource is not found."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         resource: str = "Resource",
@@ -79,9 +98,10 @@ class ResourceNotFoundError(AppException):
             resource_id: The ID of the resource that was not found
             details: Additional error details
         """
-        message = f"{resource} not found"
         if resource_id:
             message = f"{resource} with ID '{resource_id}' not found"
+        else:
+            message = _resource_message(resource, "not found")
 
         super().__init__(message=message, status_code=404, details=details)
 
@@ -89,19 +109,23 @@ class ResourceNotFoundError(AppException):
 class ResourceAlreadyExistsError(AppException):
     """Exception raised when attempting to create a resource that already exists."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         resource: str = "Resource",
         details: Optional[dict[str, Any]] = None,
     ) -> None:
         """Initialize resource already exists error with 409 status code."""
-        message = f"{resource} already exists"
+        message = _resource_message(resource, "already exists")
         super().__init__(message=message, status_code=409, details=details)
 
 
 class ExternalServiceError(AppException):
     """Exception raised for external service failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         service: str,
@@ -123,6 +147,8 @@ class ExternalServiceError(AppException):
 class RateLimitError(AppException):
     """Exception raised when rate limit is exceeded."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -147,6 +173,8 @@ class RateLimitError(AppException):
 class DatabaseError(AppException):
     """Exception raised for database operation failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Database operation failed",
@@ -159,6 +187,8 @@ class DatabaseError(AppException):
 class CacheError(AppException):
     """Exception raised for cache operation failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Cache operation failed",
@@ -171,6 +201,8 @@ class CacheError(AppException):
 class AgentError(AppException):
     """Exception raised for agent processing failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Agent processing failed",
@@ -183,6 +215,8 @@ class AgentError(AppException):
 class ToolExecutionError(AppException):
     """Exception raised for tool execution failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         tool_name: str,
@@ -204,6 +238,8 @@ class ToolExecutionError(AppException):
 class FileUploadError(AppException):
     """Exception raised for file upload failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "File upload failed",
@@ -216,6 +252,8 @@ class FileUploadError(AppException):
 class ConfigurationError(AppException):
     """Exception raised for configuration errors."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Configuration error",
@@ -4,11 +4,17 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
 from app.core.config import settings
 
+_configured = False
+
+# Settings are frozen, so the per-record app context is built once
+_APP_CONTEXT = {"app": settings.APP_NAME, "environment": settings.APP_ENV}
+
 
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """
@@ -22,13 +28,28 @@ def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     Returns:
         Updated event dictionary with app context
     """
-    event_dict["app"] = settings.APP_NAME
-    event_dict["environment"] = settings.APP_ENV
+    event_dict.update(_APP_CONTEXT)
     return event_dict
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log record with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 def configure_logging() -> None:
-    """Configure structured logging for the application."""
+    """
+    Configure structured logging for the application.
+
+    Called explicitly by entry points; repeated calls are no-ops.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
     # Determine log level
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 
@@ -52,8 +73,10 @@ def configure_logging() -> None:
 
     # Add appropriate renderer based on environment
     if settings.is_production:
-        # JSON output for production (easier to parse)
-        processors.append(structlog.processors.JSONRenderer())
+        # JSON output for production (easier to parse); exc_info is rendered into
+        # an "exception" field first, since the JSON renderer drops it otherwise
+        processors.append(structlog.processors.format_exc_info)
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         # Console output for development (easier to read)
         processors.append(structlog.dev.ConsoleRenderer())
@@ -81,8 +104,10 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
-# Configure logging on module import
-configure_logging()
-
-# Export a default logger
-logger = get_logger(__name__)
+def __getattr__(name: str) -> Any:
+    """Create the default ``logger`` export on first access (PEP 562)."""
+    if name == "logger":
+        default_logger = get_logger(__name__)
+        globals()["logger"] = default_logger
+        return default_logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,162 +1,217 @@
 """Prometheus metrics definitions and utilities."""
 
-from functools import wraps
-from time import time
+from functools import lru_cache, wraps
+from time import monotonic_ns
 from typing import Any, Callable
 
 from prometheus_client import Counter, Gauge, Histogram
 
+from app.core.config import settings
+
+
+class _NoopMetric:
+    """Stand-in for a Prometheus metric when ENABLE_METRICS is off."""
+
+    __slots__ = ()
+
+    def labels(self, *args: Any, **kwargs: Any) -> "_NoopMetric":
+        return self
+
+    def inc(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def dec(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def set_function(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def observe(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+_NOOP_METRIC = _NoopMetric()
+
+
+def _counter(*args: Any, **kwargs: Any) -> Any:
+    """Create a Counter, or a no-op stand-in if metrics are disabled."""
+    return Counter(*args, **kwargs) if settings.ENABLE_METRICS else _NOOP_METRIC
+
+
+def _gauge(*args: Any, **kwargs: Any) -> Any:
+    """Create a Gauge, or a no-op stand-in if metrics are disabled."""
+    return Gauge(*args, **kwargs) if settings.ENABLE_METRICS else _NOOP_METRIC
+
+
+def _histogram(*args: Any, **kwargs: Any) -> Any:
+    """Create a Histogram, or a no-op stand-in if metrics are disabled."""
+    return Histogram(*args, **kwargs) if settings.ENABLE_METRICS else _NOOP_METRIC
+
+
 # HTTP Metrics (will be auto-instrumented by prometheus-fastapi-instrumentator)
 # These are defined here for reference and custom tracking
 
 # Agent Metrics
-agent_queries_total = Counter(
+agent_queries_total = _counter(
     "agent_queries_total",
     "Total number of agent queries",
     ["user_role", "intent", "status"],
 )
 
-agent_response_duration_seconds = Histogram(
+agent_response_duration_seconds = _histogram(
     "agent_response_duration_seconds",
     "Agent response time in seconds",
-    ["intent", "tools_used"],
+    ["intent", "tool_count"],
     buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
 )
 
-agent_tokens_used_total = Counter(
+agent_tokens_used_total = _counter(
     "agent_tokens_used_total",
     "Total tokens used by agent",
     ["model", "type"],
 )
 
-agent_tool_calls_total = Counter(
+agent_tool_calls_total = _counter(
     "agent_tool_calls_total",
     "Total tool invocations",
     ["tool_name", "status"],
 )
 
-agent_conversations_total = Counter(
+agent_conversations_total = _counter(
     "agent_conversations_total",
     "Total conversations created",
     ["user_role"],
 )
 
-agent_messages_total = Counter(
+agent_messages_total = _counter(
     "agent_messages_total",
     "Total messages sent",
     ["role"],
 )
 
 # Knowledge Base Metrics
-kb_documents_uploaded_total = Counter(
+kb_documents_uploaded_total = _counter(
     "kb_documents_uploaded_total",
     "Total documents uploaded",
     ["file_type", "status"],
 )
 
-kb_documents_total = Gauge(
+kb_documents_total = _gauge(
     "kb_documents_total",
     "Current number of documents",
     ["user_id"],
 )
 
-kb_chunks_total = Gauge(
+kb_chunks_total = _gauge(
     "kb_chunks_total",
     "Total number of document chunks",
 )
 
-kb_searches_total = Counter(
+kb_searches_total = _counter(
     "kb_searches_total",
     "Total KB search operations",
     ["status"],
 )
 
-kb_search_duration_seconds = Histogram(
+kb_search_duration_seconds = _histogram(
     "kb_search_duration_seconds",
     "KB search duration in seconds",
     buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0),
 )
 
-kb_search_results_count = Histogram(
+kb_search_results_count = _histogram(
     "kb_search_results_count",
     "Number of results returned from KB search",
     buckets=(0, 1, 3, 5, 10, 20, 50),
 )
 
 # User Metrics
-users_registered_total = Counter(
+users_registered_total = _counter(
     "users_registered_total",
     "Total users registered",
 )
 
-users_active_total = Gauge(
+users_active_total = _gauge(
     "users_active_total",
     "Number of active users",
 )
 
-users_logged_in_total = Counter(
+users_logged_in_total = _counter(
     "users_logged_in_total",
     "Total user logins",
 )
 
-auth_attempts_total = Counter(
+auth_attempts_total = _counter(
     "auth_attempts_total",
     "Total authentication attempts",
     ["status"],
 )
 
-auth_token_refreshes_total = Counter(
+auth_token_refreshes_total = _counter(
     "auth_token_refreshes_total",
     "Total token refresh operations",
 )
 
 # Database Metrics
-db_connections_active = Gauge(
+db_connections_active = _gauge(
     "db_connections_active",
     "Number of active database connections",
 )
 
-db_connections_idle = Gauge(
+db_connections_idle = _gauge(
     "db_connections_idle",
     "Number of idle database connections",
 )
 
-db_connections_total = Gauge(
+db_connections_total = _gauge(
     "db_connections_total",
     "Total number of database connections",
 )
 
-db_query_duration_seconds = Histogram(
+db_connections_overflow = _gauge(
+    "db_connections_overflow",
+    "Number of database connections open beyond the pool size",
+)
+
+db_pool_size = _gauge(
+    "db_pool_size",
+    "Configured database connection pool size",
+)
+
+db_query_duration_seconds = _histogram(
     "db_query_duration_seconds",
     "Database query duration in seconds",
     ["operation"],
     buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0),
 )
 
-db_queries_total = Counter(
+db_queries_total = _counter(
     "db_queries_total",
     "Total database queries",
     ["operation", "status"],
 )
 
 # Cache Metrics
-cache_hits_total = Counter(
+cache_hits_total = _counter(
     "cache_hits_total",
     "Total cache hits",
 )
 
-cache_misses_total = Counter(
+cache_misses_total = _counter(
     "cache_misses_total",
     "Total cache misses",
 )
 
-cache_operations_total = Counter(
+cache_operations_total = _counter(
     "cache_operations_total",
     "Total cache operations",
     ["operation", "status"],
 )
 
-cache_operation_duration_seconds = Histogram(
+cache_operation_duration_seconds = _histogram(
     "cache_operation_duration_seconds",
     "Cache operation duration in seconds",
     ["operation"],
@@ -164,32 +219,70 @@ cache_operation_duration_seconds = Histogram(
 )
 
 # Vector Store Metrics
-vector_store_operations_total = Counter(
+vector_store_operations_total = _counter(
     "vector_store_operations_total",
     "Total vector store operations",
     ["operation", "status"],
 )
 
-vector_store_operation_duration_seconds = Histogram(
+vector_store_operation_duration_seconds = _histogram(
     "vector_store_operation_duration_seconds",
     "Vector store operation duration in seconds",
     ["operation"],
     buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0),
 )
 
-vector_store_vectors_total = Gauge(
+vector_store_vectors_total = _gauge(
     "vector_store_vectors_total",
     "Total number of vectors stored",
 )
 
 # Feedback Metrics
-feedback_submitted_total = Counter(
+feedback_submitted_total = _counter(
     "feedback_submitted_total",
     "Total feedback submissions",
     ["rating"],
 )
 
 
+# Labeled children are resolved once and reused: .labels() builds and hashes
+# a label tuple on every call. Small fixed label sets are prebuilt, open-ended
+# ones are memoized with a bound so unexpected values can't grow without limit.
+_cache_operation_counters = {
+    operation: cache_operations_total.labels(operation=operation, status="success")
+    for operation in ("get", "set", "delete")
+}
+
+
+@lru_cache(maxsize=256)
+def _agent_query_counter(user_role: str, intent: str, status: str) -> Any:
+    """Get the agent_queries_total child for a label set."""
+    return agent_queries_total.labels(user_role=user_role, intent=intent, status=status)
+
+
+# Tool counts are bucketed so each intent has at most three duration series;
+# labelling by the joined tool names made a series per tool combination
+_TOOL_COUNT_LABELS = ("0", "1", "2+")
+
+
+@lru_cache(maxsize=256)
+def _agent_duration_histogram(intent: str, tool_count: str) -> Any:
+    """Get the agent_response_duration_seconds child for a label set."""
+    return agent_response_duration_seconds.labels(intent=intent, tool_count=tool_count)
+
+
+@lru_cache(maxsize=256)
+def _tool_call_counter(tool_name: str, status: str) -> Any:
+    """Get the agent_tool_calls_total child for a label set."""
+    return agent_tool_calls_total.labels(tool_name=tool_name, status=status)
+
+
+@lru_cache(maxsize=256)
+def _token_usage_counter(model: str, token_type: str) -> Any:
+    """Get the agent_tokens_used_total child for a label set."""
+    return agent_tokens_used_total.labels(model=model, type=token_type)
+
+
 # Decorator for tracking metrics
 def track_agent_query(func: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -204,7 +297,7 @@ def track_agent_query(func: Callable[..., Any]) -> Callable[..., Any]:
 
     @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time()
+        start_ns = monotonic_ns()
         status = "success"
         intent = kwargs.get("intent", "unknown")
         tools = kwargs.get("tools", [])
@@ -217,16 +310,14 @@ def track_agent_query(func: Callable[..., Any]) -> Callable[..., Any]:
             status = "error"
             raise
         finally:
-            duration = time() - start_time
+            duration = (monotonic_ns() - start_ns) / 1e9
 
             # Record metrics
-            agent_response_duration_seconds.labels(
-                intent=intent, tools_used=",".join(tools) if tools else "none"
+            _agent_duration_histogram(
+                intent, _TOOL_COUNT_LABELS[min(len(tools), 2)]
             ).observe(duration)
 
-            agent_queries_total.labels(
-                user_role=user_role, intent=intent, status=status
-            ).inc()
+            _agent_query_counter(user_role, intent, status).inc()
 
     return wrapper
 
@@ -239,7 +330,7 @@ def track_tool_call(tool_name: str, status: str = "success") -> None:
         tool_name: Name of the tool
         status: Status of the call (success/error)
     """
-    agent_tool_calls_total.labels(tool_name=tool_name, status=status).inc()
+    _tool_call_counter(tool_name, status).inc()
 
 
 def track_token_usage(model: str, token_type: str, count: int) -> None:
@@ -251,7 +342,7 @@ def track_token_usage(model: str, token_type: str, count: int) -> None:
         token_type: Type of tokens (prompt/completion)
         count: Number of tokens used
     """
-    agent_tokens_used_total.labels(model=model, type=token_type).inc(count)
+    _token_usage_counter(model, token_type).inc(count)
 
 
 def track_cache_operation(operation: str, hit: bool = False) -> None:
@@ -268,4 +359,7 @@ def track_cache_operation(operation: str, hit: bool = False) -> None:
         else:
             cache_misses_total.inc()
 
-    cache_operations_total.labels(operation=operation, status="success").inc()
+    counter = _cache_operation_counters.get(operation)
+    if counter is None:
+        counter = cache_operations_total.labels(operation=operation, status="success")
+    counter.inc()
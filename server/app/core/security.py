@@ -1,15 +1,75 @@
 """Security utilities for authentication and authorization."""
 
-from datetime import datetime, timedelta
+import asyncio
+import time
+from datetime import timedelta
 from typing import Any, Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from cryptography.hazmat.primitives import serialization
+from jwt import InvalidTokenError
 
 from app.core.config import settings
+from app.core.exceptions import ConfigurationError
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Token "type" claims
+TOKEN_TYPE_ACCESS = "access"
+TOKEN_TYPE_REFRESH = "refresh"
+TOKEN_TYPE_INVITATION = "invitation"
+TOKEN_TYPE_WIDGET_SESSION = "widget_session"
+
+# Default lifetimes for tokens without a configurable expiry
+INVITATION_TOKEN_TTL_SECONDS = 7 * 24 * 60 * 60
+WIDGET_SESSION_TOKEN_TTL_SECONDS = 5 * 60
+
+
+def _load_jwt_keys() -> tuple[Any, Any]:
+    """
+    Resolve the JWT signing and verification keys once at import.
+
+    HMAC algorithms sign and verify with SECRET_KEY. EdDSA uses the configured
+    PEM key pair, parsed here so encode/decode never re-parse PEM.
+
+    Returns:
+        Tuple of (signing_key, verification_key)
+
+    Raises:
+        ConfigurationError: If EdDSA is selected without both PEM keys
+    """
+    if settings.JWT_ALGORITHM != "EdDSA":
+        return settings.SECRET_KEY, settings.SECRET_KEY
+
+    if not settings.JWT_PRIVATE_KEY or not settings.JWT_PUBLIC_KEY:
+        raise ConfigurationError(
+            "JWT_PRIVATE_KEY and JWT_PUBLIC_KEY are required when JWT_ALGORITHM is EdDSA"
+        )
+    return (
+        serialization.load_pem_private_key(settings.JWT_PRIVATE_KEY.encode(), password=None),
+        serialization.load_pem_public_key(settings.JWT_PUBLIC_KEY.encode()),
+    )
+
+
+_SIGNING_KEY, _VERIFICATION_KEY = _load_jwt_keys()
+
+# bcrypt only uses the first 72 bytes of a password. Truncate explicitly so
+# existing hashes keep verifying on bcrypt releases that reject longer input
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def _bcrypt_verify(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash."""
+    return bcrypt.checkpw(
+        plain_password.encode()[:_BCRYPT_MAX_PASSWORD_BYTES], hashed_password.encode()
+    )
+
+
+def _bcrypt_hash(password: str) -> str:
+    """Hash a password with bcrypt at the configured cost."""
+    return bcrypt.hashpw(
+        password.encode()[:_BCRYPT_MAX_PASSWORD_BYTES],
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS),
+    ).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -23,7 +83,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return _bcrypt_verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -36,7 +96,47 @@ def get_password_hash(password: str) -> str:
     Returns:
         The hashed password
     """
-    return pwd_context.hash(password)
+    return _bcrypt_hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread so bcrypt doesn't block the event loop.
+
+    Args:
+        plain_password: The plain text password
+        hashed_password: The hashed password to verify against
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await asyncio.to_thread(_bcrypt_verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password in a worker thread so bcrypt doesn't block the event loop.
+
+    Args:
+        password: The plain text password to hash
+
+    Returns:
+        The hashed password
+    """
+    return await asyncio.to_thread(_bcrypt_hash, password)
+
+
+def _expires_at(lifetime_seconds: float) -> int:
+    """
+    Get a JWT ``exp`` claim (NumericDate) for a token issued now.
+
+    Args:
+        lifetime_seconds: Token lifetime in seconds
+
+    Returns:
+        Expiry as integer seconds since the epoch
+    """
+    return int(time.time() + lifetime_seconds)
 
 
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -50,16 +150,13 @@ def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta]
     Returns:
         The encoded JWT token
     """
-    to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    lifetime = (
+        expires_delta.total_seconds()
+        if expires_delta
+        else settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    )
+    to_encode = {**data, "exp": _expires_at(lifetime), "type": TOKEN_TYPE_ACCESS}
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def create_refresh_token(data: dict[str, Any]) -> str:
@@ -72,11 +169,12 @@ def create_refresh_token(data: dict[str, Any]) -> str:
     Returns:
         The encoded JWT refresh token
     """
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    to_encode = {
+        **data,
+        "exp": _expires_at(settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400),
+        "type": TOKEN_TYPE_REFRESH,
+    }
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def create_invitation_token(email: str, role: str, expires_delta: Optional[timedelta] = None) -> str:
@@ -91,16 +189,14 @@ def create_invitation_token(email: str, role: str, expires_delta: Optional[timed
     Returns:
         The encoded JWT invitation token
     """
-    to_encode = {"email": email, "role": role, "type": "invitation"}
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(days=7)  # Default 7 days expiration
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    lifetime = expires_delta.total_seconds() if expires_delta else INVITATION_TOKEN_TTL_SECONDS
+    to_encode = {
+        "email": email,
+        "role": role,
+        "type": TOKEN_TYPE_INVITATION,
+        "exp": _expires_at(lifetime),
+    }
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def create_widget_session_token(widget_id: str, expires_delta: Optional[timedelta] = None) -> str:
@@ -114,17 +210,13 @@ def create_widget_session_token(widget_id: str, expires_delta: Optional[timedelt
     Returns:
         The encoded JWT widget session token
     """
-    to_encode = {"widget_id": widget_id, "type": "widget_session"}
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        # Default 5 minutes expiration for widget sessions
-        expire = datetime.utcnow() + timedelta(minutes=5)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    lifetime = expires_delta.total_seconds() if expires_delta else WIDGET_SESSION_TOKEN_TTL_SECONDS
+    to_encode = {
+        "widget_id": widget_id,
+        "type": TOKEN_TYPE_WIDGET_SESSION,
+        "exp": _expires_at(lifetime),
+    }
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> dict[str, Any]:
@@ -138,13 +230,13 @@ def decode_token(token: str) -> dict[str, Any]:
         The decoded token payload
 
     Raises:
-        JWTError: If token is invalid or expired
+        InvalidTokenError: If token is invalid or expired
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, _VERIFICATION_KEY, algorithms=[settings.JWT_ALGORITHM])
         return payload
-    except JWTError as e:
-        raise JWTError(f"Invalid token: {str(e)}") from e
+    except InvalidTokenError as e:
+        raise InvalidTokenError(f"Invalid token: {str(e)}") from e
 
 
 def verify_token_type(payload: dict[str, Any], expected_type: str) -> bool:
@@ -188,13 +280,24 @@ def validate_password_strength(password: str) -> tuple[bool, Optional[str]]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    if not any(c.isupper() for c in password):
+    # Classify characters in one pass, stopping once every class is seen
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit:
+            return True, None
+
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
 
-    if not any(c.islower() for c in password):
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
 
-    if not any(c.isdigit() for c in password):
-        return False, "Password must contain at least one digit"
-
-    return True, None
+    return False, "Password must contain at least one digit"
@@ -1,12 +1,14 @@
 """Base class for SQLAlchemy models."""
 
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
-from uuid import uuid4
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from uuid6 import uuid7
 
 
 class Base(DeclarativeBase):
@@ -20,9 +22,9 @@ class BaseModel(Base):
 
     __abstract__ = True
 
-    id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid4, index=True
-    )
+    # UUIDv7 ids are time-ordered, so inserts append to the right edge of the
+    # primary key index instead of landing on random leaf pages
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -33,6 +35,16 @@ class BaseModel(Base):
         nullable=False,
     )
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _column_names(cls) -> tuple[str, ...]:
+        """Column names of the model's table, computed once per class."""
+        return tuple(c.name for c in cls.__table__.columns)
+
     def dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        names = self._column_names()
+        values = attrgetter(*names)(self)
+        if len(names) == 1:
+            values = (values,)
+        return dict(zip(names, values))
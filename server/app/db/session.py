@@ -4,18 +4,48 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.metrics import (
+    db_connections_active,
+    db_connections_idle,
+    db_connections_overflow,
+    db_connections_total,
+    db_pool_size,
+)
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
+    poolclass=AsyncAdaptedQueuePool,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    connect_args=(
+        {
+            # SQLAlchemy's adapter-level cache of asyncpg prepared statements
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            # asyncpg's own statement cache used for non-prepared execution
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        }
+        if settings.DATABASE_URL.startswith("postgresql+asyncpg")
+        else {}
+    ),
 )
 
+# Pool gauges are read from the pool at scrape time, so checkouts pay nothing
+_pool = engine.pool
+db_connections_active.set_function(_pool.checkedout)
+db_connections_idle.set_function(_pool.checkedin)
+db_connections_total.set_function(lambda: _pool.checkedout() + _pool.checkedin())
+db_connections_overflow.set_function(lambda: max(_pool.overflow(), 0))
+db_pool_size.set_function(_pool.size)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -1,38 +1,36 @@
-import os
+import logging
+from functools import lru_cache
 from typing import Annotated, Literal, TypedDict, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph, MessagesState
 from langchain_core.tools import tool
 from langchain_core.messages import ToolMessage, SystemMessage
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
+from app.formzed.service.llm import shared_llm, trim_history
+from app.formzed.service.vector_store import get_embeddings, get_vector_db
+
+logger = logging.getLogger(__name__)
 
 # Define custom state
 class AgentState(MessagesState):
     final_agent_a_output: Optional[str]
 
-# Load the vector database
-# vector_db is located at ../vector_db relative to this file
-DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "vector_db")
-try:
-    embeddings = OpenAIEmbeddings()
-    vector_db = FAISS.load_local(DB_PATH, embeddings, allow_dangerous_deserialization=True)
-except Exception as e:
-    print(f"Error loading vector database: {e}")
-    vector_db = None
+@lru_cache(maxsize=2048)
+def embed_query(query: str) -> tuple:
+    """Embed a search query, reusing the vector for repeated queries."""
+    return tuple(get_embeddings().embed_query(query))
 
 @tool
 def search(query: str):
     """Search the vector database for relevant information based on the query."""
+    vector_db = get_vector_db()
     if vector_db is None:
         return "Error: Vector database is not available."
     
     try:
-        results = vector_db.similarity_search(query, k=3)
+        results = vector_db.similarity_search_by_vector(list(embed_query(query)), k=3)
         # Combine the content of the retrieved documents
         return "\n\n---\n\n".join([doc.page_content for doc in results])
     except Exception as e:
@@ -44,6 +42,7 @@ def submit_survey_outline(outline: str):
     return "Outline submitted successfully."
 
 tools = [search, submit_survey_outline]
+TOOL_MAP = {t.name: t for t in tools}
 
 # Define the system prompt for the Product Manager
 SYSTEM_PROMPT = """You are Agent A: The Product Manager (Orchestrator) for a SurveyJS form builder system.
@@ -85,17 +84,18 @@ Do NOT write the final JSON code. Your output is the textual PLAN and STRUCTURE
 Be helpful, professional, and guide the user step-by-step.
 """
 
+# Built once so every call shares the same system message instance
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
 # Define the model
-model = ChatOpenAI(model="gpt-4o-mini", temperature=0).bind_tools(tools)
+model = shared_llm.bind_tools(tools)
 
 # Define the function that calls the model
 def call_model(state: AgentState):
-    messages = state['messages']
-    messages_with_system = [SystemMessage(content=SYSTEM_PROMPT)] + messages
-    response = model.invoke(messages_with_system)
-    print(f"\n[Agent A] Model Response: {response.content}")
+    response = model.invoke([SYSTEM_MESSAGE, *trim_history(state['messages'])])
+    logger.debug("[Agent A] Model Response: %s", response.content)
     if response.tool_calls:
-        print(f"[Agent A] Tool Calls: {response.tool_calls}")
+        logger.debug("[Agent A] Tool Calls: %s", response.tool_calls)
     return {"messages": [response]}
 
 # Define the function that calls tools
@@ -111,31 +111,32 @@ def call_tools(state: AgentState):
         tool_name = tool_call["name"]
         tool_args = tool_call["args"]
         
-        print(f"[Agent A] Calling Tool: {tool_name} with args: {tool_args}")
+        logger.debug("[Agent A] Calling Tool: %s with args: %s", tool_name, tool_args)
         
-        # Find and call the tool
-        for tool in tools:
-            if tool.name == tool_name:
-                result = tool.invoke(tool_args)
-                
-                # Truncate long results for logging
-                log_result = str(result)
-                if len(log_result) > 500:
-                    log_result = log_result[:500] + "... (truncated)"
-                print(f"[Agent A] Tool Result: {log_result}")
-                
-                tool_messages.append(
-                    ToolMessage(
-                        content=str(result),
-                        tool_call_id=tool_call["id"]
-                    )
+        tool = TOOL_MAP.get(tool_name)
+        if tool is None:
+            logger.warning("[Agent A] Unknown tool: %s", tool_name)
+            tool_messages.append(
+                ToolMessage(
+                    content=f"Error: Unknown tool '{tool_name}'.", tool_call_id=tool_call["id"]
                 )
-                
-                # Special handling for the final output tool
-                if tool_name == "submit_survey_outline":
-                    state_update["final_agent_a_output"] = tool_args.get("outline")
-                    print(f"[Agent A] Setting final_agent_a_output...")
-                break
+            )
+            continue
+        
+        result = tool.invoke(tool_args)
+        logger.debug("[Agent A] Tool Result: %s", result)
+        
+        tool_messages.append(
+            ToolMessage(
+                content=str(result),
+                tool_call_id=tool_call["id"]
+            )
+        )
+        
+        # Special handling for the final output tool
+        if tool_name == "submit_survey_outline":
+            state_update["final_agent_a_output"] = tool_args.get("outline")
+            logger.debug("[Agent A] Setting final_agent_a_output...")
     
     state_update["messages"] = tool_messages
     return state_update
@@ -152,9 +153,9 @@ def should_continue(state: AgentState) -> Literal["tools", END]:
 
 def should_continue_tools(state: AgentState) -> Literal["agent", END]:
     if state.get("final_agent_a_output"):
-        print("[Agent A] Final output found. Ending.")
+        logger.debug("[Agent A] Final output found. Ending.")
         return END
-    print("[Agent A] Final output NOT found. Looping back to agent.")
+    logger.debug("[Agent A] Final output NOT found. Looping back to agent.")
     return "agent"
 
 def get_graph(checkpointer=None):
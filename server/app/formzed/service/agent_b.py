@@ -1,13 +1,17 @@
+import logging
 import os
+from functools import lru_cache
 from typing import Annotated, Literal, TypedDict, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph, MessagesState
 from langchain_core.tools import tool
 from langchain_core.messages import ToolMessage, SystemMessage
+from app.formzed.service.llm import shared_llm, trim_history
+
+logger = logging.getLogger(__name__)
 
 # Define custom state
 class AgentBState(MessagesState):
@@ -20,6 +24,7 @@ def submit_content_object(content_object: str):
     return "Content object submitted successfully."
 
 tools = [submit_content_object]
+TOOL_MAP = {t.name: t for t in tools}
 
 # Define the system prompt for the Content Designer
 SYSTEM_PROMPT = """You are Agent B: The Content Designer (Creative) for a SurveyJS form builder system.
@@ -52,8 +57,18 @@ Page 2: Feedback
 Be creative but stick to the requirements in the outline.
 """
 
+# Built once so every call shares the same system message instance
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+@lru_cache(maxsize=128)
+def outline_message(input_outline: str) -> SystemMessage:
+    """Context message carrying the outline; reused while the same outline is being designed."""
+    return SystemMessage(
+        content=f"Here is the survey outline to design content for:\n{input_outline}"
+    )
+
 # Define the model
-model = ChatOpenAI(model="gpt-4o-mini", temperature=0).bind_tools(tools)
+model = shared_llm.bind_tools(tools)
 
 # Define the function that calls the model
 def call_model(state: AgentBState):
@@ -66,16 +81,15 @@ def call_model(state: AgentBState):
     # Let's add the input_outline as a context message if it exists and isn't in messages
     
     input_outline = state.get("input_outline", "")
-    context_message = f"Here is the survey outline to design content for:\n{input_outline}"
     
-    messages_with_system = [SystemMessage(content=SYSTEM_PROMPT)] + messages
+    messages_with_system = [SYSTEM_MESSAGE, *trim_history(messages)]
     if input_outline:
-         messages_with_system.append(SystemMessage(content=context_message))
+        messages_with_system.append(outline_message(input_outline))
 
     response = model.invoke(messages_with_system)
-    print(f"\n[Agent B] Model Response: {response.content}")
+    logger.debug("[Agent B] Model Response: %s", response.content)
     if response.tool_calls:
-        print(f"[Agent B] Tool Calls: {response.tool_calls}")
+        logger.debug("[Agent B] Tool Calls: %s", response.tool_calls)
     return {"messages": [response]}
 
 # Define the function that calls tools
@@ -91,24 +105,30 @@ def call_tools(state: AgentBState):
         tool_name = tool_call["name"]
         tool_args = tool_call["args"]
         
-        print(f"[Agent B] Calling Tool: {tool_name} with args: {tool_args}")
+        logger.debug("[Agent B] Calling Tool: %s with args: %s", tool_name, tool_args)
         
-        # Find and call the tool
-        for tool in tools:
-            if tool.name == tool_name:
-                result = tool.invoke(tool_args)
-                print(f"[Agent B] Tool Result: {result}")
-                tool_messages.append(
-                    ToolMessage(
-                        content=str(result),
-                        tool_call_id=tool_call["id"]
-                    )
+        tool = TOOL_MAP.get(tool_name)
+        if tool is None:
+            logger.warning("[Agent B] Unknown tool: %s", tool_name)
+            tool_messages.append(
+                ToolMessage(
+                    content=f"Error: Unknown tool '{tool_name}'.", tool_call_id=tool_call["id"]
                 )
-                
-                if tool_name == "submit_content_object":
-                    state_update["final_agent_b_output"] = tool_args.get("content_object")
-                    print(f"[Agent B] Setting final_agent_b_output...")
-                break
+            )
+            continue
+        
+        result = tool.invoke(tool_args)
+        logger.debug("[Agent B] Tool Result: %s", result)
+        tool_messages.append(
+            ToolMessage(
+                content=str(result),
+                tool_call_id=tool_call["id"]
+            )
+        )
+        
+        if tool_name == "submit_content_object":
+            state_update["final_agent_b_output"] = tool_args.get("content_object")
+            logger.debug("[Agent B] Setting final_agent_b_output...")
     
     state_update["messages"] = tool_messages
     return state_update
@@ -123,9 +143,9 @@ def should_continue(state: AgentBState) -> Literal["tools", END]:
 
 def should_continue_tools(state: AgentBState) -> Literal["agent", END]:
     if state.get("final_agent_b_output"):
-        print("[Agent B] Final output found. Ending.")
+        logger.debug("[Agent B] Final output found. Ending.")
         return END
-    print("[Agent B] Final output NOT found. Looping back to agent.")
+    logger.debug("[Agent B] Final output NOT found. Looping back to agent.")
     return "agent"
 
 def get_graph(checkpointer=None):
@@ -1,35 +1,35 @@
-import os
-import json
+import logging
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Literal, TypedDict, Any, Optional, Dict, List
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, Field
 from langgraph.graph import END, START, StateGraph, MessagesState
 from langchain_core.tools import tool
 from langchain_core.messages import ToolMessage, SystemMessage, AIMessage, HumanMessage
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
-from app.formzed.service.schema_loader import get_schema_elements, resolve_reference
-
-# Load the vector database
-# vector_db is located at ../vector_db relative to this file
-DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "vector_db")
-try:
-    embeddings = OpenAIEmbeddings()
-    vector_db = FAISS.load_local(DB_PATH, embeddings, allow_dangerous_deserialization=True)
-except Exception as e:
-    print(f"Error loading vector database: {e}")
-    vector_db = None
+from app.formzed.service.json_utils import extract_json
+from app.formzed.service.llm import shared_llm
+from app.formzed.service.schema_loader import get_schema_elements, resolve_reference_text
+from app.formzed.service.vector_store import get_vector_db
+
+logger = logging.getLogger(__name__)
 
 # --- State Definition ---
 class AgentCState(MessagesState):
     input_content_object: Optional[str]
     namespace_map: Optional[Dict[str, Any]] # Stores IDs
+    namespace_map_json: Optional[str] # namespace_map serialized once for later prompts
     partial_json: Optional[Dict[str, Any]] # Stores the evolving JSON
     final_agent_c_output: Optional[str]
 
+class NamespaceMap(BaseModel):
+    """Identifier strings declared in Phase 1."""
+    page_ids: List[str] = Field(description="Unique page names, e.g. page_intro")
+    question_ids: List[str] = Field(description="Unique question names, e.g. q_email")
+
 # --- Tools ---
 @tool
 def get_schema_elements_tool():
@@ -46,12 +46,7 @@ def resolve_schema_reference_tool(reference: str):
     Args:
         reference: The reference string, e.g., "#page", "#panel", "#text", "#rating".
     """
-    if not reference.startswith("#"):
-        reference = f"#{reference}"
-    result = resolve_reference(reference)
-    if "error" in result:
-        return result["error"]
-    return json.dumps(result, indent=2)
+    return resolve_reference_text(reference)
 
 @tool
 def search_schema_index(query: str):
@@ -59,6 +54,7 @@ def search_schema_index(query: str):
     Search the master index (documentation) for information about SurveyJS elements, properties, and concepts.
     Use this to understand WHAT elements are available and HOW they work before using them.
     """
+    vector_db = get_vector_db()
     if vector_db is None:
         return "Error: Vector database is not available."
     
@@ -69,10 +65,17 @@ def search_schema_index(query: str):
         return f"Error during search: {e}"
 
 tools = [get_schema_elements_tool, resolve_schema_reference_tool, search_schema_index]
+TOOL_MAP = {t.name: t for t in tools}
+
+# Shared pool for running a model turn's independent tool calls in parallel
+tool_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent-c-tools")
 
 # --- Model ---
-base_model = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+base_model = shared_llm
 model_with_tools = base_model.bind_tools(tools)
+namespace_model = base_model.with_structured_output(
+    NamespaceMap, method="json_schema", include_raw=True
+)
 
 # --- Prompts ---
 
@@ -94,21 +97,6 @@ Return a JSON object with `page_ids` (list of strings) and `question_ids` (list
 Do NOT generate the full survey JSON yet. Just the IDs.
 """
 
-PHASE_2_PROMPT = """You are Agent C (Phase 2: Global Configuration).
-Your goal is to initialize the root object of the survey.
-
-**Input:**
-Namespace Map (IDs) from Phase 1.
-
-**Task:**
-1.  Create the Root Object.
-2.  Set `mode` to "edit" (so the user can fill it out) and `questionsOnPageMode` (usually "standard").
-3.  Initialize empty arrays for dependency containers: `pages`, `triggers`, `calculatedValues`.
-
-**Output:**
-Return the initial JSON skeleton.
-"""
-
 PHASE_3_PROMPT = """You are Agent C (Phase 3: Content Definition).
 Your goal is to populate the `pages` and `elements` in the JSON.
 
@@ -185,55 +173,65 @@ Your goal is to fix the validation errors in the SurveyJS JSON.
 Return the FIXED valid SurveyJS JSON string.
 """
 
-# --- Nodes ---
-
-import re
-
-def extract_json(text):
-    """
-    Extract JSON object from text, handling markdown code blocks and surrounding text.
-    """
-    text = text.strip()
-    
-    # Try to find JSON block with ```json wrapper
-    match = re.search(r"```json\s*(\{.*?\})\s*```", text, re.DOTALL)
-    if match:
-        return match.group(1)
-        
-    # Try to find JSON block with just ``` wrapper
-    match = re.search(r"```\s*(\{.*?\})\s*```", text, re.DOTALL)
-    if match:
-        return match.group(1)
-
-    match = re.search(r"(\{.*\})", text, re.DOTALL)
-    if match:
-        return match.group(1)
-        
-    return text
+# System messages are static, so they are built once at import
+PHASE_1_MESSAGE = SystemMessage(content=PHASE_1_PROMPT)
+PHASE_3_MESSAGE = SystemMessage(content=PHASE_3_PROMPT)
+PHASE_4_MESSAGE = SystemMessage(content=PHASE_4_PROMPT)
+PHASE_5_MESSAGE = SystemMessage(content=PHASE_5_PROMPT)
+FIX_AGENT_MESSAGE = SystemMessage(content=FIX_AGENT_PROMPT)
 
 # --- Nodes ---
 
 def run_phase_1(state: AgentCState):
-    print("--- Agent C: Phase 1 (Namespace) ---")
+    logger.info("Agent C: Phase 1 (Namespace)")
     input_content = state.get("input_content_object", "")
-    print("Input content:", input_content)
+    logger.debug("Input content: %s", input_content)
     
     messages = [
-        SystemMessage(content=PHASE_1_PROMPT),
+        PHASE_1_MESSAGE,
         HumanMessage(content=f"Requirements: {input_content}")
     ]
-    print("Phase 1 input messages:", messages)
-    response = base_model.invoke(messages)
-    print("Phase 1 response:", response.content)
+    logger.debug("Phase 1 input messages: %s", messages)
+    result = namespace_model.invoke(messages)
+    response = result["raw"]
+    logger.debug("Phase 1 response: %s", response.content)
     
-    try:
-        content = extract_json(response.content)
-        namespace_map = json.loads(content)
-        print("Phase 1 namespace_map:", namespace_map)
-        return {"namespace_map": namespace_map, "messages": [response]}
-    except Exception as e:
-        print("Phase 1 failed:", str(e))
-        return {"namespace_map": {}, "messages": [response]}
+    # Phase 2 (Global Configuration) is fixed, so the skeleton is built here
+    # instead of asking the model for it
+    partial_json = {
+        "mode": "edit",
+        "questionsOnPageMode": "standard",
+        "pages": [],
+        "triggers": [],
+        "calculatedValues": [],
+    }
+    
+    if result["parsed"] is None:
+        logger.warning("Phase 1 failed: %s", result["parsing_error"])
+        return {
+            "namespace_map": {},
+            "namespace_map_json": "{}",
+            "partial_json": partial_json,
+            "messages": [response],
+        }
+    
+    namespace_map = result["parsed"].model_dump()
+    logger.debug("Phase 1 namespace_map: %s", namespace_map)
+    return {
+        "namespace_map": namespace_map,
+        "namespace_map_json": orjson.dumps(namespace_map).decode(),
+        "partial_json": partial_json,
+        "messages": [response],
+    }
+
+def dispatch_tool(tc):
+    """Run a single tool call and wrap its result in a ToolMessage."""
+    tool = TOOL_MAP.get(tc["name"])
+    if tool is None:
+        res = f"Error: Unknown tool '{tc['name']}'."
+    else:
+        res = tool.invoke(tc["args"])
+    return ToolMessage(content=str(res), tool_call_id=tc["id"])
 
 def execute_tools_loop(messages, model, max_iterations=10):
     """
@@ -248,20 +246,13 @@ def execute_tools_loop(messages, model, max_iterations=10):
         if not response.tool_calls:
             break
             
-        print(f"Tool loop iteration {i+1}/{max_iterations}")
+        logger.debug("Tool loop iteration %d/%d", i + 1, max_iterations)
             
-        # Execute tools
-        tool_outputs = []
-        for tc in response.tool_calls:
-            if tc["name"] == "get_schema_elements_tool":
-                res = get_schema_elements_tool.invoke({})
-            elif tc["name"] == "resolve_schema_reference_tool":
-                res = resolve_schema_reference_tool.invoke(tc["args"])
-            elif tc["name"] == "search_schema_index":
-                res = search_schema_index.invoke(tc["args"])
-            else:
-                res = "Unknown tool"
-            tool_outputs.append(ToolMessage(content=str(res), tool_call_id=tc["id"]))
+        # Execute the turn's tool calls concurrently; map keeps them in call order
+        if len(response.tool_calls) == 1:
+            tool_outputs = [dispatch_tool(response.tool_calls[0])]
+        else:
+            tool_outputs = list(tool_executor.map(dispatch_tool, response.tool_calls))
         
         new_messages.extend(tool_outputs)
         
@@ -272,127 +263,122 @@ def execute_tools_loop(messages, model, max_iterations=10):
         
     return new_messages, response
 
-def run_phase_2(state: AgentCState):
-    print("--- Agent C: Phase 2 (Global Config) ---")
-    namespace_map = state.get("namespace_map", {})
-    print("Phase 2 input namespace_map:", namespace_map)
-    
-    messages = [
-        SystemMessage(content=PHASE_2_PROMPT),
-        HumanMessage(content=f"Namespace Map: {json.dumps(namespace_map)}")
-    ]
-    response = base_model.invoke(messages)
-    print("Phase 2 response:", response.content)
-    
-    try:
-        content = extract_json(response.content)
-        partial_json = json.loads(content)
-        print("Phase 2 partial_json:", partial_json)
-        return {"partial_json": partial_json, "messages": [response]}
-    except Exception as e:
-        print("Phase 2 failed:", str(e))
-        return {"partial_json": {}, "messages": [response]}
-
 def run_phase_3(state: AgentCState):
-    print("--- Agent C: Phase 3 (Content Definition) ---")
+    logger.info("Agent C: Phase 3 (Content Definition)")
     partial_json = state.get("partial_json", {})
-    namespace_map = state.get("namespace_map", {})
+    namespace_map_json = state.get("namespace_map_json") or "{}"
     input_content = state.get("input_content_object", "")
-    print("Phase 3 inputs - partial_json:", partial_json)
-    print("Phase 3 inputs - namespace_map:", namespace_map)
+    logger.debug("Phase 3 inputs - partial_json: %s", partial_json)
+    logger.debug("Phase 3 inputs - namespace_map: %s", namespace_map_json)
     
     # Prepare initial context
     initial_messages = state["messages"] + [
-        SystemMessage(content=PHASE_3_PROMPT),
-        HumanMessage(content=f"Current JSON: {json.dumps(partial_json)}\nNamespace Map: {json.dumps(namespace_map)}\nRequirements: {input_content}")
+        PHASE_3_MESSAGE,
+        HumanMessage(
+            content=f"Current JSON: {orjson.dumps(partial_json).decode()}\n"
+            f"Namespace Map: {namespace_map_json}\n"
+            f"Requirements: {input_content}"
+        )
     ]
     
     # Run loop
     new_messages, final_response = execute_tools_loop(initial_messages, model_with_tools)
-    print("Phase 3 final response:", final_response.content)
+    logger.debug("Phase 3 final response: %s", final_response.content)
 
     try:
         content = extract_json(final_response.content)
-        updated_json = json.loads(content)
-        print("Phase 3 updated_json:", updated_json)
+        updated_json = orjson.loads(content)
+        logger.debug("Phase 3 updated_json: %s", updated_json)
         return {"partial_json": updated_json, "messages": new_messages}
     except Exception as e:
-        print("Phase 3 failed:", str(e))
+        logger.warning("Phase 3 failed: %s", e)
         return {"messages": new_messages}
 
 def run_phase_4(state: AgentCState):
-    print("--- Agent C: Phase 4 (Wiring) ---")
+    logger.info("Agent C: Phase 4 (Wiring)")
     partial_json = state.get("partial_json", {})
     input_content = state.get("input_content_object", "")
-    print("Phase 4 inputs - partial_json:", partial_json)
+    logger.debug("Phase 4 inputs - partial_json: %s", partial_json)
     
     # Prepare initial context
     initial_messages = state["messages"] + [
-        SystemMessage(content=PHASE_4_PROMPT),
-        HumanMessage(content=f"Current JSON: {json.dumps(partial_json)}\nRequirements: {input_content}")
+        PHASE_4_MESSAGE,
+        HumanMessage(
+            content=f"Current JSON: {orjson.dumps(partial_json).decode()}\n"
+            f"Requirements: {input_content}"
+        )
     ]
     
     # Run loop
     new_messages, final_response = execute_tools_loop(initial_messages, model_with_tools)
-    print("Phase 4 final response:", final_response.content)
+    logger.debug("Phase 4 final response: %s", final_response.content)
     
     try:
         content = extract_json(final_response.content)
-        updated_json = json.loads(content)
-        print("Phase 4 updated_json:", updated_json)
+        updated_json = orjson.loads(content)
+        logger.debug("Phase 4 updated_json: %s", updated_json)
         return {"partial_json": updated_json, "messages": new_messages}
     except Exception as e:
-        print("Phase 4 failed:", str(e))
+        logger.warning("Phase 4 failed: %s", e)
         return {"messages": new_messages}
 
+# Global properties Phase 5 is responsible for adding
+POLISH_KEYS = frozenset({"title", "logo", "completedHtml", "showProgressBar"})
+
 def run_phase_5(state: AgentCState):
-    print("--- Agent C: Phase 5 (Polish) ---")
+    logger.info("Agent C: Phase 5 (Polish)")
     partial_json = state.get("partial_json", {})
-    print("Phase 5 input partial_json:", partial_json)
+    logger.debug("Phase 5 input partial_json: %s", partial_json)
+    
+    # Earlier phases sometimes add the polish already; skip the model call then
+    missing = POLISH_KEYS - partial_json.keys()
+    if not missing and all("description" in page for page in partial_json.get("pages", [])):
+        logger.info("Phase 5 skipped: survey already polished")
+        return {"final_agent_c_output": orjson.dumps(partial_json).decode()}
     
     messages = state["messages"] + [
-        SystemMessage(content=PHASE_5_PROMPT),
-        HumanMessage(content=f"Current JSON: {json.dumps(partial_json)}")
+        PHASE_5_MESSAGE,
+        HumanMessage(content=f"Current JSON: {orjson.dumps(partial_json).decode()}")
     ]
     
     response = base_model.invoke(messages)
-    print("Phase 5 response:", response.content)
+    logger.debug("Phase 5 response: %s", response.content)
     
     try:
         content = extract_json(response.content)
-        print("Raw content:", content)
+        logger.debug("Raw content: %s", content)
         # Validate it's JSON
-        parsed_json = json.loads(content)
-        print("JSON content:", parsed_json)
+        parsed_json = orjson.loads(content)
+        logger.debug("JSON content: %s", parsed_json)
         return {"final_agent_c_output": content, "messages": [response]}
     except Exception as e:
-        print("JSON parsing failed:", str(e))
-        print("Content that failed:", content)
+        logger.warning("JSON parsing failed: %s", e)
+        logger.debug("Content that failed: %s", content)
         # Return content anyway so validation node can catch it (or main graph can see it failed)
         return {"final_agent_c_output": content, "messages": [response]}
 
 # --- Fixing Agent Node ---
 def run_fix_agent(state: AgentCState):
-    print("--- Agent C: Fixing Agent ---")
+    logger.info("Agent C: Fixing Agent")
     messages = state["messages"]
 
     existing_messages = state.get("messages", [])
     
     # Construct prompt messages
-    prompt_messages = [SystemMessage(content=FIX_AGENT_PROMPT)] + existing_messages
+    prompt_messages = [FIX_AGENT_MESSAGE] + existing_messages
     
     # Run the tool loop
     new_messages, final_response = execute_tools_loop(prompt_messages, model_with_tools)
-    print("Fixing Agent response:", final_response.content)
+    logger.debug("Fixing Agent response: %s", final_response.content)
     
     try:
         content = extract_json(final_response.content)
         # Validate it's JSON
-        parsed_json = json.loads(content)
-        print("Fixed JSON content:", parsed_json)
+        parsed_json = orjson.loads(content)
+        logger.debug("Fixed JSON content: %s", parsed_json)
         return {"final_agent_c_output": content, "messages": new_messages}
     except Exception as e:
-        print("Fixing Agent failed to parse JSON:", str(e))
+        logger.warning("Fixing Agent failed to parse JSON: %s", e)
         # Return content anyway
         return {"final_agent_c_output": content, "messages": new_messages}
 
@@ -411,15 +397,13 @@ def get_graph(checkpointer=None):
     workflow = StateGraph(AgentCState)
     
     workflow.add_node("phase_1", run_phase_1)
-    workflow.add_node("phase_2", run_phase_2)
     workflow.add_node("phase_3", run_phase_3)
     workflow.add_node("phase_4", run_phase_4)
     workflow.add_node("phase_5", run_phase_5)
     workflow.add_node("fix_agent", run_fix_agent)
     
     workflow.add_conditional_edges(START, route_start)
-    workflow.add_edge("phase_1", "phase_2")
-    workflow.add_edge("phase_2", "phase_3")
+    workflow.add_edge("phase_1", "phase_3")
     workflow.add_edge("phase_3", "phase_4")
     workflow.add_edge("phase_4", "phase_5")
     workflow.add_edge("phase_5", END)
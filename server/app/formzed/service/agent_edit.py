@@ -1,26 +1,16 @@
-import os
 import json
 from typing import Annotated, Literal, TypedDict, Optional, List
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph, MessagesState
 from langchain_core.tools import tool
 from langchain_core.messages import ToolMessage, SystemMessage, AIMessage, HumanMessage
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
-from app.formzed.service.schema_loader import resolve_reference
-
-# Load the vector database
-DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "vector_db")
-try:
-    embeddings = OpenAIEmbeddings()
-    vector_db = FAISS.load_local(DB_PATH, embeddings, allow_dangerous_deserialization=True)
-except Exception as e:
-    print(f"Error loading vector database: {e}")
-    vector_db = None
+from app.formzed.service.json_utils import extract_json
+from app.formzed.service.llm import shared_llm
+from app.formzed.service.schema_loader import resolve_reference_text
+from app.formzed.service.vector_store import get_vector_db
 
 # --- State Definition ---
 class EditState(MessagesState):
@@ -36,12 +26,7 @@ def resolve_schema_reference_tool(reference: str):
     Args:
         reference: The reference string, e.g., "#page", "#panel", "#text", "#rating".
     """
-    if not reference.startswith("#"):
-        reference = f"#{reference}"
-    result = resolve_reference(reference)
-    if "error" in result:
-        return result["error"]
-    return json.dumps(result, indent=2)
+    return resolve_reference_text(reference)
 
 @tool
 def search_schema_index(query: str):
@@ -49,6 +34,7 @@ def search_schema_index(query: str):
     Search the master index (documentation) for information about SurveyJS elements, properties, and concepts.
     Use this to understand WHAT elements are available and HOW they work before using them.
     """
+    vector_db = get_vector_db()
     if vector_db is None:
         return "Error: Vector database is not available."
     
@@ -73,8 +59,8 @@ def submit_edit_plan(plan: str):
 conversing_tools = [submit_edit_plan]
 
 # --- Models ---
-conversing_model = ChatOpenAI(model="gpt-4o-mini", temperature=0).bind_tools(conversing_tools)
-editing_model = ChatOpenAI(model="gpt-4o-mini", temperature=0).bind_tools(editing_tools)
+conversing_model = shared_llm.bind_tools(conversing_tools)
+editing_model = shared_llm.bind_tools(editing_tools)
 
 # --- Prompts ---
 CONVERSING_SYSTEM_PROMPT = """You are the Survey Editor Assistant.
@@ -161,17 +147,6 @@ def run_conversing_tools(state: EditState):
     state_update["messages"] = tool_messages
     return state_update
 
-def extract_json(text):
-    import re
-    text = text.strip()
-    match = re.search(r"```json\s*(\{.*?\})\s*```", text, re.DOTALL)
-    if match: return match.group(1)
-    match = re.search(r"```\s*(\{.*?\})\s*```", text, re.DOTALL)
-    if match: return match.group(1)
-    match = re.search(r"(\{.*\})", text, re.DOTALL)
-    if match: return match.group(1)
-    return text
-
 def run_editing_agent(state: EditState):
     print("--- Running Edit Executor Agent ---")
     current_json = state.get("final_json")
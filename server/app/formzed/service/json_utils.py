@@ -0,0 +1,34 @@
+def extract_json(text):
+    """
+    Extract the first JSON object from text, skipping a ```json fence and surrounding prose.
+    Scans once, tracking brace depth outside string literals, and returns the
+    balanced object (or the rest of the text if it never closes).
+    """
+    text = text.strip()
+    fence = text.find("```json")
+    start = text.find("{", 0 if fence == -1 else fence + 7)
+    if start == -1:
+        return text
+    
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return text[start:]
@@ -0,0 +1,52 @@
+import httpx
+from langchain_core.messages import trim_messages
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_openai import ChatOpenAI
+
+from app.formzed.service.llm_cache import llm_cache
+
+# One connection pool per process for every agent's OpenAI calls, so keep-alive
+# connections and TLS sessions are shared instead of each model opening its own.
+# HTTP/2 multiplexes concurrent requests over those connections.
+# The agent nodes only call invoke, so no async client is configured.
+http_client = httpx.Client(
+    http2=True, limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+
+# Shared chat model; agents bind their own tools off it
+shared_llm = ChatOpenAI(
+    model="gpt-4o-mini",
+    temperature=0,
+    cache=llm_cache,
+    http_client=http_client,
+)
+
+
+def close_llm_http_client() -> None:
+    """Close the shared HTTP client used by the agents' chat model."""
+    http_client.close()
+
+
+# Only the most recent history up to this many tokens is sent with each call
+MAX_HISTORY_TOKENS = 6000
+
+
+def trim_history(messages):
+    """Keep the latest messages within MAX_HISTORY_TOKENS, starting on a user or AI turn
+    so tool calls are never separated from their results.
+
+    The current turn (the last user message onwards) is always kept whole, even
+    when it alone exceeds the budget, so the model never loses the request it is
+    answering."""
+    trimmed = trim_messages(
+        messages,
+        max_tokens=MAX_HISTORY_TOKENS,
+        strategy="last",
+        token_counter=count_tokens_approximately,
+        start_on=("human", "ai"),
+    )
+    for i in range(len(messages) - 1, -1, -1):
+        if messages[i].type == "human":
+            # trimmed is a suffix of messages; extend it back to the last user message
+            return trimmed if len(trimmed) >= len(messages) - i else messages[i:]
+    return trimmed
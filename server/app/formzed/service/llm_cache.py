@@ -0,0 +1,8 @@
+from langchain_core.caches import InMemoryCache
+
+# Shared exact-match cache for the agents' chat models.
+# Responses are keyed on the full prompt plus the model parameters (including
+# bound tools), so only byte-identical calls are served from the cache.
+LLM_CACHE_SIZE = 1024
+
+llm_cache = InMemoryCache(maxsize=LLM_CACHE_SIZE)
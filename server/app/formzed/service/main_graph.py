@@ -1,4 +1,4 @@
-import json
+import orjson
 from typing import TypedDict, Annotated, List, Dict, Any, Optional
 from langgraph.graph import StateGraph, END, START, MessagesState
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
@@ -78,7 +78,7 @@ def run_validation(state: MainState):
         return {"validation_error": "No JSON to validate."}
     
     try:
-        json_data = json.loads(json_str)
+        json_data = orjson.loads(json_str)
         validation_result = validate_json(json_data)
         
         if validation_result == "Valid":
@@ -88,7 +88,7 @@ def run_validation(state: MainState):
             print(f"--- JSON Validation Failed: {validation_result} ---")
             return {"validation_error": validation_result}
             
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"--- JSON Decode Error: {e} ---")
         return {"validation_error": f"Invalid JSON format: {e}"}
 
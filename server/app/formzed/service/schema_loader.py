@@ -1,5 +1,7 @@
 import json
 import os
+from functools import lru_cache
+import orjson
 from typing import Dict, Any, List, Optional
 
 SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "surveyjs_definition.json")
@@ -39,6 +41,21 @@ def resolve_reference(ref: str) -> Dict[str, Any]:
         
     return {"error": f"Reference '{ref}' not found in schema definitions."}
 
+@lru_cache(maxsize=512)
+def resolve_reference_text(ref: str) -> str:
+    """
+    Resolves a reference and returns its definition as JSON text (or the error message).
+    The schema is static, so results are cached per reference.
+    """
+    if not ref.startswith("#"):
+        ref = f"#{ref}"
+    result = resolve_reference(ref)
+    if "error" in result:
+        return result["error"]
+    # Compact output: indentation only costs the model input tokens
+    return orjson.dumps(result).decode()
+
+@lru_cache(maxsize=1)
 def get_schema_elements() -> str:
     """
     Returns a summary of available elements (questions, panels, etc.) from the schema.
@@ -1,7 +1,6 @@
 import json
 import os
-import jsonschema
-from jsonschema import validate
+import fastjsonschema
 
 SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "surveyjs_definition.json")
 
@@ -15,6 +14,31 @@ def load_schema():
 
 SURVEY_SCHEMA = load_schema()
 
+def strip_dangling_refs(node, definitions):
+    """
+    Drops "$ref"s to definitions the schema does not contain (the SurveyJS schema
+    references a missing PanelLayoutColumnModel), leaving those values unchecked.
+    fastjsonschema resolves every ref up front and would otherwise refuse to compile.
+    """
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if (
+            isinstance(ref, str)
+            and ref.startswith("#/definitions/")
+            and ref[len("#/definitions/"):] not in definitions
+        ):
+            node = {k: v for k, v in node.items() if k != "$ref"}
+        return {k: strip_dangling_refs(v, definitions) for k, v in node.items()}
+    if isinstance(node, list):
+        return [strip_dangling_refs(v, definitions) for v in node]
+    return node
+
+# Compiled once into Python code specialized to the schema
+SURVEY_VALIDATE = (
+    fastjsonschema.compile(strip_dangling_refs(SURVEY_SCHEMA, SURVEY_SCHEMA.get("definitions", {})))
+    if SURVEY_SCHEMA else None
+)
+
 def validate_json(json_data: dict) -> str:
     """
     Validates the given JSON object against the SurveyJS schema.
@@ -24,11 +48,11 @@ def validate_json(json_data: dict) -> str:
         return "Error: Schema not loaded."
     
     try:
-        validate(instance=json_data, schema=SURVEY_SCHEMA)
+        SURVEY_VALIDATE(json_data)
         return "Valid"
-    except jsonschema.exceptions.ValidationError as e:
+    except fastjsonschema.JsonSchemaValueException as e:
         # Return a concise error message
-        return f"Validation Error: {e.message} at path: {list(e.path)}"
+        return f"Validation Error: {e.message} at path: {e.path}"
     except Exception as e:
         return f"Unexpected Error: {e}"
 
@@ -0,0 +1,7 @@
+import os
+
+# vector_db is located at ../vector_db relative to this file
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "vector_db")
+
+# Inverted lists probed per query when the index is IVF (see scripts/rebuild_vector_index.py)
+IVF_NPROBE = 8
@@ -0,0 +1,53 @@
+import logging
+import os
+import pickle
+from functools import lru_cache
+
+from langchain_community.vectorstores import FAISS
+from langchain_openai import OpenAIEmbeddings
+
+from app.formzed.service.vector_config import DB_PATH, IVF_NPROBE
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_embeddings():
+    """Create the embeddings client once per process."""
+    return OpenAIEmbeddings()
+
+
+@lru_cache(maxsize=1)
+def _load_vector_db():
+    """Load the vector database; only successful loads are cached."""
+    import faiss
+
+    index = faiss.read_index(
+        os.path.join(DB_PATH, "index.faiss"),
+        faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY,
+    )
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.nprobe = IVF_NPROBE
+    with open(os.path.join(DB_PATH, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return FAISS(
+        embedding_function=get_embeddings(),
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+    )
+
+
+def get_vector_db():
+    """Load the vector database on first use and reuse it afterwards.
+
+    The FAISS index is memory-mapped read-only so forked workers share its
+    pages instead of each reading a private copy. Returns None if loading fails;
+    the next call tries again.
+    """
+    try:
+        return _load_vector_db()
+    except Exception:
+        logger.exception("Error loading vector database from %s", DB_PATH)
+        return None
@@ -11,7 +11,7 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from app.api.v1 import api_router
 from app.core.config import settings
 from app.core.exceptions import AppException
-from app.core.logging import logger
+from app.core.logging import configure_logging, logger
 from app.schemas.common import ErrorResponse, HealthResponse
 
 # Add custom middleware (in reverse order of execution)
@@ -21,6 +21,11 @@ from app.api.middleware import (
     SecurityLoggingMiddleware,
 )
 from app.cache.redis_client import redis_client
+from app.formzed.service.llm import close_llm_http_client
+from app.vector_store.qdrant_client import close_qdrant_http_client
+
+configure_logging()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -48,6 +53,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error disconnecting Redis client: {e}")
 
+    # Close shared Qdrant HTTP client
+    try:
+        await close_qdrant_http_client()
+    except Exception as e:
+        logger.error(f"Error closing Qdrant HTTP client: {e}")
+
+    # Close the formzed agents' shared OpenAI HTTP client
+    try:
+        close_llm_http_client()
+    except Exception as e:
+        logger.error(f"Error closing LLM HTTP client: {e}")
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -63,7 +80,7 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -117,18 +134,29 @@ async def validation_exception_handler(
     )
 
 
+# Body for unexpected errors is the same every time, so build it once
+_INTERNAL_ERROR_BODY = ErrorResponse(
+    error="InternalServerError", message="An unexpected error occurred"
+).model_dump()
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Handle unexpected exceptions."""
+    """Handle unexpected exceptions.
+
+    The error is logged once with its traceback; the response never includes the
+    exception text, which may leak internals.
+    """
     logger.error(
-        "Unexpected error", error=str(exc), error_type=type(exc).__name__, path=request.url.path
+        "Unexpected error",
+        error=str(exc),
+        error_type=type(exc).__name__,
+        path=request.url.path,
+        exc_info=exc,
     )
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
-            error="InternalServerError",
-            message="An unexpected error occurred" if settings.is_production else str(exc),
-        ).model_dump(),
+        content=_INTERNAL_ERROR_BODY,
     )
 
 
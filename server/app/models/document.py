@@ -21,7 +21,7 @@ class Document(BaseModel):
     file_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
     file_hash: Mapped[str | None] = mapped_column(
         String(64), nullable=True, unique=True, index=True
-    )  # SHA256 hash for duplicate detection
+    )  # BLAKE3 hash for duplicate detection (SHA256 for rows not yet rehashed)
     status: Mapped[str] = mapped_column(
         String(50), default="processing", nullable=False, index=True
     )  # processing, done, failed
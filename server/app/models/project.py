@@ -1,6 +1,6 @@
 """Project model."""
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base_class import BaseModel
@@ -10,6 +10,7 @@ class Project(BaseModel):
     """Project model."""
 
     __tablename__ = "projects"
+    __table_args__ = (Index("ix_projects_created_at_id", "created_at", "id"),)
 
     title: Mapped[str] = mapped_column(String(255), nullable=False)
 
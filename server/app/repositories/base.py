@@ -1,9 +1,10 @@
 """Base repository with generic CRUD operations."""
 
+from datetime import datetime
 from typing import Any, Generic, Optional, TypeVar
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, delete, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base_class import BaseModel
@@ -93,6 +94,30 @@ class BaseRepository(Generic[ModelType]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_keyset_page(
+        self,
+        limit: int = 100,
+        after: Optional[tuple[datetime, UUID]] = None,
+        skip: int = 0,
+    ) -> tuple[list[ModelType], bool]:
+        """Get a page of records in (created_at, id) descending order.
+        
+        Args:
+            limit: Maximum number of records to return
+            after: (created_at, id) of the last record of the previous page
+            skip: Number of records to skip (only used when after is not given)
+            
+        Returns:
+            Tuple of (list of model instances, whether more records exist)
+        """
+        query = self._apply_keyset(select(self.model), after)
+        if after is None and skip:
+            query = query.offset(skip)
+
+        result = await self.db.execute(query.limit(limit + 1))
+        records = list(result.scalars().all())
+        return records[:limit], len(records) > limit
+
     async def count(self, filters: Optional[dict[str, Any]] = None) -> int:
         """Count records with optional filtering.
         
@@ -154,6 +179,82 @@ class BaseRepository(Generic[ModelType]):
         await self.db.flush()
         return True
 
+    async def exists(self, record_id: UUID) -> bool:
+        """Check whether a record exists without loading it.
+        
+        Args:
+            record_id: Record UUID
+            
+        Returns:
+            True if the record exists
+        """
+        query = select(literal(1)).where(self.model.id == record_id).limit(1)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def get_many(self, record_ids: list[UUID]) -> list[ModelType]:
+        """Get all records whose ID is in the given list in a single query.
+        
+        Args:
+            record_ids: Record UUIDs
+            
+        Returns:
+            Model instances found (missing IDs are skipped, order is not preserved)
+        """
+        result = await self.db.execute(select(self.model).where(self.model.id.in_(record_ids)))
+        return list(result.scalars().all())
+
+    async def update_many(
+        self, record_ids: list[UUID], obj_in: dict[str, Any]
+    ) -> list[ModelType]:
+        """Apply the same field values to many records with one UPDATE ... RETURNING.
+        
+        Args:
+            record_ids: Record UUIDs
+            obj_in: Dictionary of field values to update
+            
+        Returns:
+            Updated model instances
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(record_ids))
+            .values(**obj_in)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete_many(self, record_ids: list[UUID]) -> list[UUID]:
+        """Delete many records with one DELETE ... RETURNING.
+        
+        Args:
+            record_ids: Record UUIDs
+            
+        Returns:
+            IDs of the deleted records
+        """
+        stmt = delete(self.model).where(self.model.id.in_(record_ids)).returning(self.model.id)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    def _apply_keyset(
+        self, query: Select, after: Optional[tuple[datetime, UUID]] = None
+    ) -> Select:
+        """Order a query by (created_at, id) descending and seek past a cursor.
+        
+        Args:
+            query: SQLAlchemy select query
+            after: (created_at, id) of the last record of the previous page
+            
+        Returns:
+            Modified query with keyset ordering and predicate applied
+        """
+        if after is not None:
+            query = query.where(tuple_(self.model.created_at, self.model.id) < after)
+        return query.order_by(self.model.created_at.desc(), self.model.id.desc())
+
     def _apply_filters(self, query: Select, filters: dict[str, Any]) -> Select:
         """Apply filters to a query.
         
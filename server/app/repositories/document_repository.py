@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import or_, select, func
+from sqlalchemy import Row, or_, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.document import Document
@@ -13,6 +13,20 @@ from app.repositories.base import BaseRepository
 class DocumentRepository(BaseRepository[Document]):
     """Repository for document operations."""
 
+    # Columns needed by document listings (skips JSONB metadata and file hash)
+    LIST_COLUMNS = (
+        Document.id,
+        Document.user_id,
+        Document.title,
+        Document.filename,
+        Document.file_type,
+        Document.file_size,
+        Document.status,
+        Document.chunk_count,
+        Document.created_at,
+        Document.updated_at,
+    )
+
     def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         super().__init__(Document, db)
@@ -27,7 +41,7 @@ class DocumentRepository(BaseRepository[Document]):
         status: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = "desc",
-    ) -> tuple[list[Document], int]:
+    ) -> tuple[list[Row], int]:
         """Get documents by user ID with pagination, search, and filtering.
         
         Args:
@@ -41,9 +55,9 @@ class DocumentRepository(BaseRepository[Document]):
             sort_order: Sort order (asc/desc)
             
         Returns:
-            Tuple of (documents list, total count)
+            Tuple of (document rows with LIST_COLUMNS, total count)
         """
-        query = select(Document).where(Document.user_id == user_id)
+        query = select(*self.LIST_COLUMNS).where(Document.user_id == user_id)
         count_query = select(func.count()).select_from(Document).where(Document.user_id == user_id)
 
         # Apply search filter
@@ -92,7 +106,7 @@ class DocumentRepository(BaseRepository[Document]):
 
         # Execute query
         result = await self.db.execute(query)
-        documents = result.scalars().all()
+        documents = result.all()
 
         return list(documents), total or 0
     
@@ -105,7 +119,7 @@ class DocumentRepository(BaseRepository[Document]):
         status: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = "desc",
-    ) -> tuple[list[Document], int]:
+    ) -> tuple[list[Row], int]:
         """Get all documents (admin access) with pagination, search, and filtering.
         
         Args:
@@ -118,9 +132,9 @@ class DocumentRepository(BaseRepository[Document]):
             sort_order: Sort order (asc/desc)
             
         Returns:
-            Tuple of (documents list, total count)
+            Tuple of (document rows with LIST_COLUMNS, total count)
         """
-        query = select(Document)
+        query = select(*self.LIST_COLUMNS)
         count_query = select(func.count()).select_from(Document)
 
         # Apply search filter
@@ -169,6 +183,6 @@ class DocumentRepository(BaseRepository[Document]):
 
         # Execute query
         result = await self.db.execute(query)
-        documents = result.scalars().all()
+        documents = result.all()
 
         return list(documents), total or 0
\ No newline at end of file
@@ -1,9 +1,13 @@
 """User repository."""
 
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.user import User
 from app.repositories.base import BaseRepository
@@ -12,6 +16,21 @@ from app.repositories.base import BaseRepository
 class UserRepository(BaseRepository[User]):
     """Repository for user operations."""
 
+    # Rows fetched per round-trip when streaming users
+    STREAM_BATCH_SIZE = 100
+
+    # Columns accepted as sort_by (the endpoint restricts sort_by to these keys)
+    SORT_COLUMNS = {
+        "email": User.email,
+        "first_name": User.first_name,
+        "last_name": User.last_name,
+        "phone_number": User.phone_number,
+        "role": User.role,
+        "is_active": User.is_active,
+        "created_at": User.created_at,
+        "updated_at": User.updated_at,
+    }
+
     def __init__(self, db: AsyncSession):
         """Initialize repository with database session."""
         super().__init__(User, db)
@@ -48,24 +67,128 @@ class UserRepository(BaseRepository[User]):
         is_active: Optional[bool] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = "asc",
-    ) -> tuple[list[User], int]:
+        after: Optional[tuple[datetime, UUID]] = None,
+        include_total: bool = True,
+    ) -> tuple[list[User], Optional[int], bool]:
         """
         Get multiple users with pagination, search, filter, and sort.
 
+        With the default ordering (no sort_by) rows are returned in
+        (created_at, id) descending order and ``after`` seeks past the last row
+        of the previous page instead of using OFFSET.
+
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum number of records to return
             search: Search term (searches email, first_name, and last_name)
             role: Filter by role ('admin' or 'user')
             is_active: Filter by active status
             sort_by: Column to sort by ('email', 'created_at', 'role', etc.)
             sort_order: Sort direction ('asc' or 'desc')
+            after: (created_at, id) keyset cursor, only valid with the default ordering
+            include_total: Whether to run the COUNT(*) query for the total
 
         Returns:
-            Tuple of (list of users, total count)
+            Tuple of (list of users, total count or None, whether more users exist)
+        """
+        query, count_query = self._build_multi_query(
+            search=search,
+            role=role,
+            is_active=is_active,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            after=after,
+        )
+
+        # Get total count before pagination (skipped unless requested)
+        total = None
+        if include_total:
+            count_result = await self.db.execute(count_query)
+            total = count_result.scalar_one()
+
+        # Apply pagination (fetch one extra row to detect further pages)
+        if after is None:
+            query = query.offset(skip)
+        query = query.limit(limit + 1)
+
+        # Execute query
+        result = await self.db.execute(query)
+        users = list(result.scalars().all())
+
+        return users[:limit], total, len(users) > limit
+
+    async def stream_multi(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        search: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> AsyncIterator[User]:
         """
-        # Build base query
-        query = select(User)
+        Stream users matching the same criteria as get_multi, row by row.
+
+        Rows are fetched from a server-side cursor in batches instead of being
+        materialized into a list first.
+
+        Args:
+            skip: Number of records to skip (ignored when after is given)
+            limit: Maximum number of records to return
+            search: Search term (searches email, first_name, and last_name)
+            role: Filter by role ('admin' or 'user')
+            is_active: Filter by active status
+            sort_by: Column to sort by ('email', 'created_at', 'role', etc.)
+            sort_order: Sort direction ('asc' or 'desc')
+            after: (created_at, id) keyset cursor, only valid with the default ordering
+
+        Yields:
+            User instances
+        """
+        query, _ = self._build_multi_query(
+            search=search,
+            role=role,
+            is_active=is_active,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            after=after,
+        )
+        if after is None:
+            query = query.offset(skip)
+        query = query.limit(limit).execution_options(yield_per=self.STREAM_BATCH_SIZE)
+
+        result = await self.db.stream_scalars(query)
+        async for user in result:
+            yield user
+
+    def _build_multi_query(
+        self,
+        search: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> tuple[Select, Select]:
+        """
+        Build the filtered, ordered user query and its matching count query.
+
+        Args:
+            search: Search term (searches email, first_name, and last_name)
+            role: Filter by role ('admin' or 'user')
+            is_active: Filter by active status
+            sort_by: Column to sort by ('email', 'created_at', 'role', etc.)
+            sort_order: Sort direction ('asc' or 'desc')
+            after: (created_at, id) keyset cursor, only valid with the default ordering
+
+        Returns:
+            Tuple of (user query without pagination, count query)
+        """
+        # Build base query; listings never need the password hash, and raiseload
+        # turns any accidental access into an error instead of a per-row query
+        query = select(User).options(defer(User.hashed_password, raiseload=True))
         count_query = select(func.count()).select_from(User)
 
         # Apply search filter (searches email, first_name, and last_name)
@@ -89,42 +212,20 @@ class UserRepository(BaseRepository[User]):
             query = query.where(User.is_active == is_active)
             count_query = count_query.where(User.is_active == is_active)
 
-        # Get total count before pagination
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar_one()
-
         # Apply sorting
         if sort_by:
             # Map sort_by to actual column
-            sort_column_map = {
-                "email": User.email,
-                "first_name": User.first_name,
-                "last_name": User.last_name,
-                "phone_number": User.phone_number,
-                "role": User.role,
-                "is_active": User.is_active,
-                "created_at": User.created_at,
-                "updated_at": User.updated_at,
-            }
-
-            sort_column = sort_column_map.get(sort_by)
-            if sort_column:
+            sort_column = self.SORT_COLUMNS.get(sort_by)
+            if sort_column is not None:
                 if sort_order == "desc":
                     query = query.order_by(sort_column.desc())
                 else:
                     query = query.order_by(sort_column.asc())
             else:
                 # Default sort by created_at if invalid sort_by
-                query = query.order_by(User.created_at.desc())
+                query = self._apply_keyset(query)
         else:
-            # Default sort by created_at
-            query = query.order_by(User.created_at.desc())
-
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-
-        # Execute query
-        result = await self.db.execute(query)
-        users = list(result.scalars().all())
+            # Default sort by created_at, seeking past the cursor if given
+            query = self._apply_keyset(query, after)
 
-        return users, total
+        return query, count_query
@@ -14,6 +14,7 @@ from app.schemas.conversation import (
 )
 from app.schemas.feedback import FeedbackCreate, FeedbackResponse
 from app.schemas.knowledge_base import (
+    DocumentListItem,
     DocumentResponse,
     DocumentUpload,
     SearchRequest,
@@ -58,6 +59,7 @@ __all__ = [
     # Knowledge Base
     "DocumentUpload",
     "DocumentResponse",
+    "DocumentListItem",
     "SearchRequest",
     "SearchResponse",
     "SearchResult",
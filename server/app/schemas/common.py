@@ -18,9 +18,11 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response."""
 
     items: list[T]
-    total: int
+    total: int | None = None
     skip: int
     limit: int
+    next_cursor: str | None = None
+    has_more: bool = False
 
 
 class ErrorResponse(BaseModel):
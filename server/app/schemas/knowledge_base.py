@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field
 class PaginatedDocumentsResponse(BaseModel):
     """Response schema for paginated documents list."""
 
-    items: list["DocumentResponse"] = Field(..., description="List of documents")
+    items: list["DocumentListItem"] = Field(..., description="List of documents")
     total: int = Field(..., description="Total number of documents")
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Page size")
@@ -58,6 +58,23 @@ class DocumentResponse(BaseModel):
     model_config = {"from_attributes": True, "populate_by_name": True}
 
 
+class DocumentListItem(BaseModel):
+    """Response schema for a document in listings (no metadata payload)."""
+
+    id: UUID = Field(..., description="Document ID")
+    user_id: UUID = Field(..., description="User ID")
+    title: str = Field(..., description="Document title")
+    filename: str = Field(..., description="Document filename")
+    file_type: str | None = Field(None, description="File type")
+    file_size: int | None = Field(None, description="File size in bytes")
+    status: str = Field(..., description="Processing status (processing, done, failed)")
+    chunk_count: int = Field(..., description="Number of chunks")
+    created_at: datetime = Field(..., description="Upload timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+    model_config = {"from_attributes": True}
+
+
 class SearchRequest(BaseModel):
     """Request schema for knowledge base search."""
 
@@ -1,12 +1,27 @@
 """User schemas."""
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
 
 from app.core.constants import UserRole
 
+# Query parameter values accepted by the user listing endpoint
+UserRoleName = Literal["user", "admin", "super_admin"]
+UserSortField = Literal[
+    "email",
+    "first_name",
+    "last_name",
+    "phone_number",
+    "role",
+    "is_active",
+    "created_at",
+    "updated_at",
+]
+SortOrder = Literal["asc", "desc"]
+
 
 class UserBase(BaseModel):
     """Base user schema."""
@@ -1,7 +1,7 @@
 """Analytics service for dashboard statistics."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 
 from sqlalchemy import func, select, cast, Date
@@ -39,7 +39,7 @@ class AnalyticsService:
         """
         try:
             # Calculate date thresholds
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc)
             seven_days_ago = now - timedelta(days=7)
             thirty_days_ago = now - timedelta(days=30)
 
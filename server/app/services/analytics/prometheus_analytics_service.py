@@ -1,7 +1,7 @@
 """Prometheus analytics service for querying system metrics."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 import httpx
 
@@ -34,7 +34,7 @@ class PrometheusAnalyticsService:
             - Redis connections
         """
         try:
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc)
             five_minutes_ago = now - timedelta(minutes=5)
             one_hour_ago = now - timedelta(hours=1)
             
@@ -149,7 +149,7 @@ class PrometheusAnalyticsService:
             return {
                 'enabled': False,
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': datetime.now(timezone.utc).isoformat(),
                 'cpu_usage_percent': 0.0,
                 'memory_usage_mb': 0.0,
                 'request_rate': 0.0,
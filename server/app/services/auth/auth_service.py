@@ -11,9 +11,9 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    get_password_hash,
+    get_password_hash_async,
     validate_password_strength,
-    verify_password,
+    verify_password_async,
     verify_token_type,
 )
 from app.models.user import User
@@ -63,7 +63,7 @@ class AuthService:
             raise ValidationError(error_message or "Invalid password")
 
         # Hash password and create user
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash_async(password)
         user = await self.user_repo.create(
             obj_in={
                 "email": email,
@@ -95,7 +95,7 @@ class AuthService:
             raise AuthenticationError("Invalid email or password")
 
         # Verify password
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             raise AuthenticationError("Invalid email or password")
 
         # Check if user is active
@@ -3,7 +3,7 @@
 from datetime import timedelta
 from typing import Optional
 
-from jose import JWTError
+from jwt import InvalidTokenError
 
 from app.core.exceptions import AuthenticationError
 from app.core.security import (
@@ -100,7 +100,7 @@ class TokenService:
         """
         try:
             payload = decode_token(token)
-        except JWTError as e:
+        except InvalidTokenError as e:
             raise AuthenticationError(
                 message="Invalid or expired token",
                 details={"error": str(e)},
@@ -147,7 +147,7 @@ class TokenService:
         """
         try:
             payload = decode_token(token)
-        except JWTError as e:
+        except InvalidTokenError as e:
             raise AuthenticationError(
                 message="Invalid or expired refresh token",
                 details={"error": str(e)},
@@ -3,7 +3,9 @@
 import logging
 from typing import List, Optional, Dict, Any
 
+from app.cache.memory_cache import TTLCache
 from app.integrations.openai_client import OpenAIClient, get_openai_client
+from app.core.config import settings
 from app.core.exceptions import ExternalServiceError
 
 logger = logging.getLogger(__name__)
@@ -29,6 +31,11 @@ class EmbeddingService:
         self.openai_client = openai_client or get_openai_client()
         self.batch_size = batch_size
         self.embedding_model = embedding_model
+        # Short-lived cache of single-text (query) embeddings keyed by (text, model)
+        self._embedding_cache = TTLCache(
+            maxsize=settings.KB_QUERY_EMBEDDING_CACHE_SIZE,
+            ttl=settings.KB_QUERY_EMBEDDING_CACHE_TTL,
+        )
 
     async def generate_embedding(
         self,
@@ -38,6 +45,9 @@ class EmbeddingService:
         """
         Generate embedding for a single text.
 
+        Identical texts embedded within KB_QUERY_EMBEDDING_CACHE_TTL seconds are
+        served from an in-process cache instead of calling the provider.
+
         Args:
             text: Text to embed
             metadata: Optional metadata (for logging/tracking)
@@ -48,6 +58,12 @@ class EmbeddingService:
         Raises:
             ExternalServiceError: If embedding generation fails
         """
+        cache_key = (text, self.embedding_model)
+        cached_embedding = self._embedding_cache.get(cache_key)
+        if cached_embedding is not None:
+            logger.debug("Embedding cache hit (text length: %d)", len(text))
+            return cached_embedding
+
         try:
             text_preview = text[:100] + "..." if len(text) > 100 else text
             logger.info("Generating embedding for text (length: %d): '%s'", len(text), text_preview)
@@ -58,6 +74,7 @@ class EmbeddingService:
             )
 
             logger.info("Successfully generated embedding (dimension: %d)", len(embedding))
+            self._embedding_cache.set(cache_key, embedding)
             return embedding
 
         except ExternalServiceError as e:
@@ -6,6 +6,8 @@ from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 from pathlib import Path
 
+import blake3
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.document import Document
@@ -40,6 +42,9 @@ class KnowledgeBaseService:
     # Maximum file size (50MB)
     MAX_FILE_SIZE = 50 * 1024 * 1024
 
+    # Algorithm used for file_hash (clients pre-hashing uploads must match it)
+    HASH_ALGORITHM = "blake3"
+
     def __init__(
         self,
         db: AsyncSession,
@@ -77,7 +82,9 @@ class KnowledgeBaseService:
 
     def _compute_file_hash(self, file_content: bytes) -> str:
         """
-        Compute SHA256 hash of file content for duplicate detection.
+        Compute hash of file content for duplicate detection.
+
+        Uses BLAKE3 (SIMD, multi-threaded for large inputs).
 
         Args:
             file_content: Raw file bytes
@@ -85,17 +92,36 @@ class KnowledgeBaseService:
         Returns:
             Hexadecimal hash string
         """
-        sha256_hash = hashlib.sha256(file_content).hexdigest()
-        logger.debug("Computed file hash: %s", sha256_hash)
-        return sha256_hash
+        file_hash = blake3.blake3(file_content, max_threads=blake3.blake3.AUTO).hexdigest()
+        logger.debug("Computed file hash: %s", file_hash)
+        return file_hash
+
+    def _compute_legacy_file_hash(self, file_content: bytes) -> str:
+        """
+        Compute the SHA256 hash stored for documents uploaded before BLAKE3.
+
+        Args:
+            file_content: Raw file bytes
 
-    async def check_duplicate_file(self, file_hash: str, user_id: UUID) -> Optional[Document]:
+        Returns:
+            Hexadecimal hash string
+        """
+        return hashlib.sha256(file_content).hexdigest()
+
+    async def check_duplicate_file(
+        self,
+        file_hash: str,
+        user_id: UUID,
+        legacy_hash: Optional[str] = None,
+    ) -> Optional[Document]:
         """
         Check if a file with the same hash already exists for this user.
 
         Args:
-            file_hash: SHA256 hash of the file
+            file_hash: Content hash of the file
             user_id: User ID to check against
+            legacy_hash: SHA256 hash of the file, to also match documents
+                uploaded before the switch to BLAKE3
 
         Returns:
             Existing document if duplicate found, None otherwise
@@ -104,12 +130,13 @@ class KnowledgeBaseService:
         from sqlalchemy import select
         from app.models.document import Document
 
+        hashes = [file_hash] if legacy_hash is None else [file_hash, legacy_hash]
         stmt = select(Document).where(
-            Document.file_hash == file_hash,
+            Document.file_hash.in_(hashes),
             Document.user_id == user_id
         )
         result = await self.db.execute(stmt)
-        existing_doc = result.scalar_one_or_none()
+        existing_doc = result.scalars().first()
 
         if existing_doc:
             logger.info(
@@ -152,9 +179,15 @@ class KnowledgeBaseService:
         # Compute file hash for duplicate detection
         file_hash = self._compute_file_hash(file_content)
 
-        # Check for duplicate
-        existing_doc = await self.check_duplicate_file(file_hash, user_id)
+        # Check for duplicate, including documents still stored with a SHA256 hash
+        legacy_hash = self._compute_legacy_file_hash(file_content)
+        existing_doc = await self.check_duplicate_file(file_hash, user_id, legacy_hash)
         if existing_doc:
+            if existing_doc.file_hash == legacy_hash:
+                # Rehash in place so later lookups (and client pre-hash checks) match
+                existing_doc.file_hash = file_hash
+                await self.db.commit()
+                await self.db.refresh(existing_doc)
             logger.info(
                 "Duplicate file found (user_id: %s, filename: %s, existing_doc: %s)",
                 user_id,
@@ -237,7 +270,7 @@ class KnowledgeBaseService:
         status: Optional[str] = None,
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = "desc",
-    ) -> tuple[List[Document], int]:
+    ) -> tuple[List[Row], int]:
         """
         List documents with pagination, search, filtering, and sorting.
         
@@ -255,7 +288,7 @@ class KnowledgeBaseService:
             sort_order: Sort order (asc/desc)
 
         Returns:
-            Tuple of (documents list, total count)
+            Tuple of (document rows with the listing columns, total count)
         """
         if user_id is None:
             # Admin access: return all documents
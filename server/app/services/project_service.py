@@ -8,6 +8,7 @@ from app.core.exceptions import ResourceNotFoundError
 from app.models.project import Project
 from app.repositories.project_repository import ProjectRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.utils.pagination import decode_cursor
 
 
 class ProjectService:
@@ -44,6 +45,9 @@ class ProjectService:
         await self.get_project(project_id)
         return await self.project_repo.delete(project_id)
 
-    async def list_projects(self, skip: int = 0, limit: int = 100) -> list[Project]:
-        """List projects."""
-        return await self.project_repo.get_multi(skip=skip, limit=limit)
+    async def list_projects(
+        self, skip: int = 0, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[Project], bool]:
+        """List projects newest first, returning (projects, has_more)."""
+        after = decode_cursor(cursor) if cursor else None
+        return await self.project_repo.get_keyset_page(limit=limit, after=after, skip=skip)
@@ -1,11 +1,12 @@
 """User service for user management operations."""
 
+from collections.abc import AsyncIterator
 from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.core.constants import UserRole
 from app.core.exceptions import (
@@ -14,11 +15,16 @@ from app.core.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from app.core.security import create_invitation_token, get_password_hash, validate_password_strength
+from app.core.security import (
+    create_invitation_token,
+    get_password_hash_async,
+    validate_password_strength,
+)
 from app.core.config import settings
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserCreate, UserUpdate
+from app.utils.pagination import decode_cursor
 
 
 class UserService:
@@ -71,7 +77,7 @@ class UserService:
             raise ValidationError(error_message or "Invalid password")
 
         # Hash password and create user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         user = await self.user_repo.create(
             obj_in={
                 "email": user_data.email,
@@ -103,6 +109,18 @@ class UserService:
             raise ResourceNotFoundError("User", str(user_id))
         return user
 
+    async def user_exists(self, user_id: UUID) -> bool:
+        """
+        Check whether a user exists without loading the row.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            True if the user exists
+        """
+        return await self.user_repo.exists(user_id)
+
     async def get_user_by_email(self, email: str) -> User:
         """
         Get user by email.
@@ -131,12 +149,14 @@ class UserService:
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = "asc",
         current_user: Optional[User] = None,
-    ) -> tuple[list[User], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> tuple[list[User], Optional[int], bool]:
         """
         List users with pagination, search, filtering, and sorting.
 
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (deprecated, use cursor)
             limit: Maximum number of records to return
             search: Search term (searches email, first_name, and last_name)
             role: Filter by role
@@ -144,10 +164,21 @@ class UserService:
             sort_by: Column to sort by ('email', 'created_at', 'role', etc.)
             sort_order: Sort order ('asc' or 'desc')
             current_user: Current user for permission checks
+            cursor: Keyset cursor from a previous page (default ordering only)
+            include_total: Whether to compute the total count (extra COUNT query)
 
         Returns:
-            Tuple of (list of users, total count)
+            Tuple of (list of users, total count or None, whether more users exist)
+
+        Raises:
+            ValidationError: If the cursor is invalid or combined with sort_by
         """
+        after = None
+        if cursor:
+            if sort_by:
+                raise ValidationError("Cursor pagination only supports the default ordering")
+            after = decode_cursor(cursor)
+
         return await self.user_repo.get_multi(
             skip=skip,
             limit=limit,
@@ -156,6 +187,57 @@ class UserService:
             is_active=is_active,
             sort_by=sort_by,
             sort_order=sort_order,
+            after=after,
+            include_total=include_total,
+        )
+
+    def stream_users(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        search: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[User]:
+        """
+        Stream users with the same filtering and ordering as list_users.
+
+        The cursor is validated eagerly so errors surface before any row is sent.
+
+        Args:
+            skip: Number of records to skip (deprecated, use cursor)
+            limit: Maximum number of records to return
+            search: Search term (searches email, first_name, and last_name)
+            role: Filter by role
+            is_active: Filter by active status
+            sort_by: Column to sort by ('email', 'created_at', 'role', etc.)
+            sort_order: Sort order ('asc' or 'desc')
+            cursor: Keyset cursor from a previous page (default ordering only)
+
+        Returns:
+            Async iterator over matching users
+
+        Raises:
+            ValidationError: If the cursor is invalid or combined with sort_by
+        """
+        after = None
+        if cursor:
+            if sort_by:
+                raise ValidationError("Cursor pagination only supports the default ordering")
+            after = decode_cursor(cursor)
+
+        return self.user_repo.stream_multi(
+            skip=skip,
+            limit=limit,
+            search=search,
+            role=role,
+            is_active=is_active,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            after=after,
         )
 
     async def update_user(
@@ -213,7 +295,7 @@ class UserService:
             is_valid, error_message = validate_password_strength(user_data.password)
             if not is_valid:
                 raise ValidationError(error_message or "Invalid password")
-            update_data["hashed_password"] = get_password_hash(user_data.password)
+            update_data["hashed_password"] = await get_password_hash_async(user_data.password)
 
         # Update role if provided
         if user_data.role is not None:
@@ -345,24 +427,23 @@ class UserService:
             ResourceNotFoundError: If any user not found
             AuthorizationError: If insufficient permissions
         """
-        updated_users = []
-        for user_id in user_ids:
-            user = await self.get_user(user_id)
-
+        users = await self._get_users_for_bulk(user_ids)
+        for user in users:
             # Check permissions
             if not self.can_modify_user(current_user, user):
                 raise AuthorizationError(
-                    f"Insufficient permissions to modify user {user_id}"
+                    f"Insufficient permissions to modify user {user.id}"
                 )
 
             # Prevent self-modification
-            if current_user.id == user_id:
+            if current_user.id == user.id:
                 raise ValidationError("Cannot modify your own account status")
 
-            user = await self.user_repo.update(user_id, obj_in={"is_active": is_active})
-            updated_users.append(user)
-
-        return updated_users
+        updated_users = await self.user_repo.update_many(
+            [user.id for user in users], obj_in={"is_active": is_active}
+        )
+        updated_by_id = {user.id: user for user in updated_users}
+        return [updated_by_id[user.id] for user in users]
 
     async def bulk_delete_users(
         self,
@@ -383,24 +464,40 @@ class UserService:
             ResourceNotFoundError: If any user not found
             AuthorizationError: If insufficient permissions
         """
-        deleted_ids = []
-        for user_id in user_ids:
-            user = await self.get_user(user_id)
-
+        users = await self._get_users_for_bulk(user_ids)
+        for user in users:
             # Check permissions
             if not self.can_delete_user(current_user, user):
                 raise AuthorizationError(
-                    f"Insufficient permissions to delete user {user_id}"
+                    f"Insufficient permissions to delete user {user.id}"
                 )
 
             # Prevent self-deletion
-            if current_user.id == user_id:
+            if current_user.id == user.id:
                 raise ValidationError("Cannot delete your own account")
 
-            await self.user_repo.delete(user_id)
-            deleted_ids.append(user_id)
+        deleted_ids = set(await self.user_repo.delete_many([user.id for user in users]))
+        return [user.id for user in users if user.id in deleted_ids]
+
+    async def _get_users_for_bulk(self, user_ids: list[UUID]) -> list[User]:
+        """
+        Load the users targeted by a bulk operation in a single query.
 
-        return deleted_ids
+        Args:
+            user_ids: List of user UUIDs (duplicates are ignored)
+
+        Returns:
+            Users in the order their IDs were first given
+
+        Raises:
+            ResourceNotFoundError: If any user not found
+        """
+        unique_ids = list(dict.fromkeys(user_ids))
+        users_by_id = {user.id: user for user in await self.user_repo.get_many(unique_ids)}
+        for user_id in unique_ids:
+            if user_id not in users_by_id:
+                raise ResourceNotFoundError("User", str(user_id))
+        return [users_by_id[user_id] for user_id in unique_ids]
 
     @staticmethod
     def is_admin(user: User) -> bool:
@@ -533,12 +630,12 @@ class UserService:
         invitation_token = create_invitation_token(email=email, role=role.value)
         
         # Calculate expiration (7 days from now)
-        expires_at = datetime.utcnow() + timedelta(days=7)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=7)
         
         # Generate invitation link
         # Get frontend URL from CORS origins or use default
-        # CORS_ORIGINS is already a list (parsed by validator)
-        frontend_url = settings.CORS_ORIGINS[0] if settings.CORS_ORIGINS else "http://localhost:3000"
+        cors_origins = settings.cors_origins_list
+        frontend_url = cors_origins[0] if cors_origins else "http://localhost:3000"
         invitation_link = f"{frontend_url}/sign-up?token={invitation_token}" 
 
         return {
@@ -0,0 +1,46 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from app.core.exceptions import ValidationError
+
+
+def encode_cursor(created_at: datetime, record_id: UUID) -> str:
+    """
+    Encode the position of a row in (created_at, id) order as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        record_id: ID of the last row on the page
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = f"{created_at.isoformat()}|{record_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (created_at, id) of the last row of the previous page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_raw, record_id_raw = (
+            base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(created_at_raw), UUID(record_id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValidationError("Invalid pagination cursor") from e
@@ -0,0 +1,82 @@
+"""Helpers for returning pre-serialized JSON responses."""
+
+from typing import Any, Optional
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+# Clients may keep a copy but must revalidate it (cheaply, via If-None-Match)
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def entity_etag(entity: Any) -> str:
+    """
+    Build a weak ETag for a model instance from its id and updated_at.
+
+    Args:
+        entity: Model instance with ``id`` and ``updated_at`` attributes
+
+    Returns:
+        Weak ETag header value
+    """
+    return f'W/"{entity.id}-{entity.updated_at.timestamp()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag.
+
+    Args:
+        if_none_match: If-None-Match request header value
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    value: Any,
+    status_code: int = 200,
+    headers: Optional[dict[str, str]] = None,
+    etag: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """
+    Validate a value (e.g. ORM objects) and serialize it to a JSON response.
+
+    Validation and serialization each run once in pydantic-core. FastAPI does
+    not re-validate or re-encode a returned Response, so the endpoint's
+    response_model is only used for the OpenAPI schema. Because the route
+    decorator's status_code is ignored for returned responses, pass it here.
+
+    When an ETag is given it is sent with the response, and a matching
+    If-None-Match short-circuits to an empty 304 without serializing anything.
+
+    Args:
+        adapter: TypeAdapter for the response type
+        value: Value to validate (attributes are read from objects)
+        status_code: HTTP status code
+        headers: Optional response headers
+        etag: Optional ETag of the resource
+        if_none_match: If-None-Match request header value
+
+    Returns:
+        JSON response with the serialized body, or 304 Not Modified
+    """
+    if etag is not None:
+        headers = {**(headers or {}), "ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(value, from_attributes=True)),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -9,6 +9,8 @@ import re
 from typing import List, Optional
 from pathlib import Path
 
+from app.core.constants import UserRole
+
 
 # Email validation regex (RFC 5322 simplified)
 EMAIL_REGEX = re.compile(
@@ -234,6 +236,9 @@ def validate_uuid(uuid_string: str) -> bool:
     return bool(uuid_pattern.match(uuid_string))
 
 
+_VALID_ROLES = frozenset({UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN})
+
+
 def validate_role(role: str) -> bool:
     """
     Validate user role.
@@ -250,13 +255,10 @@ def validate_role(role: str) -> bool:
         >>> validate_role("invalid_role")
         False
     """
-    from app.core.constants import UserRole
-
     if not role or not isinstance(role, str):
         return False
 
-    valid_roles = {UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN}
-    return role in valid_roles
+    return role in _VALID_ROLES
 
 
 def validate_pagination(skip: int, limit: int) -> tuple[bool, Optional[str]]:
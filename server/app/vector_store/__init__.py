@@ -3,7 +3,9 @@
 from app.vector_store.qdrant_client import (
     QdrantClientWrapper,
     close_qdrant_client,
+    close_qdrant_http_client,
     get_qdrant_client,
+    get_qdrant_http_client,
 )
 from app.vector_store.vector_operations import VectorOperations
 
@@ -12,4 +14,6 @@ __all__ = [
     "VectorOperations",
     "get_qdrant_client",
     "close_qdrant_client",
+    "get_qdrant_http_client",
+    "close_qdrant_http_client",
 ]
@@ -3,6 +3,7 @@
 import logging
 from typing import Optional
 
+import httpx
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
@@ -255,3 +256,35 @@ def close_qdrant_client() -> None:
     if _qdrant_client is not None:
         _qdrant_client.close()
         _qdrant_client = None
+
+
+# Shared HTTP client for raw Qdrant REST calls (e.g. snapshot downloads)
+_qdrant_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_qdrant_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared async HTTP client for Qdrant REST calls.
+
+    The client keeps connections alive (and negotiates HTTP/2 where the server
+    supports it) so repeated calls skip the TCP/TLS handshake.
+
+    Returns:
+        httpx.AsyncClient instance
+    """
+    global _qdrant_http_client
+    if _qdrant_http_client is None or _qdrant_http_client.is_closed:
+        _qdrant_http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=300.0,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+    return _qdrant_http_client
+
+
+async def close_qdrant_http_client() -> None:
+    """Close the shared Qdrant HTTP client."""
+    global _qdrant_http_client
+    if _qdrant_http_client is not None:
+        await _qdrant_http_client.aclose()
+        _qdrant_http_client = None
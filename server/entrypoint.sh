@@ -14,6 +14,6 @@ uv run scripts/init_db.py
 echo "Running LangGraph database initialization..."
 uv run scripts/init_db_langgraph.py
 
-# Start the application
+# Start the application (uvloop event loop; the container is always Linux)
 echo "Starting application..."
-exec uv run uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+exec uv run uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --reload
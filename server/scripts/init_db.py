@@ -3,6 +3,7 @@
 
 import asyncio
 
+from app.core.logging import configure_logging
 from app.db.init_db import init_db
 from app.db.session import AsyncSessionLocal
 
@@ -18,4 +19,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Rebuild the formzed vector index as a compressed (SQ8 or PQ) IVF index.
+
+Vectors are read back from the existing index and added in their original
+order, so the LangChain docstore mapping in index.pkl stays valid.
+"""
+
+import argparse
+import math
+import os
+
+import faiss
+import numpy as np
+
+from app.formzed.service.vector_config import DB_PATH
+
+INDEX_FILE = os.path.join(DB_PATH, "index.faiss")
+
+# FAISS wants roughly this many training points per centroid
+MIN_POINTS_PER_CENTROID = 39
+MAX_TRAINING_POINTS = 100_000
+PQ_FACTORY = "OPQ32,IVF1024,PQ32"
+
+
+def choose_factory(ntotal: int) -> str:
+    """Pick an index factory string suited to the corpus size.
+
+    Vectors are always compressed: 8-bit scalar quantization stores each
+    dimension in one byte instead of four, and large corpora use OPQ+PQ.
+    """
+    if ntotal >= 1024 * MIN_POINTS_PER_CENTROID:
+        return PQ_FACTORY
+    nlist = min(int(4 * math.sqrt(ntotal)), ntotal // MIN_POINTS_PER_CENTROID)
+    if nlist < 2:
+        # Too small to partition; scan all codes
+        return "SQ8"
+    return f"IVF{nlist},SQ8"
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--factory", help="FAISS index factory string (default: by corpus size)")
+    args = parser.parse_args()
+
+    source = faiss.read_index(INDEX_FILE)
+    source_ivf = faiss.try_extract_index_ivf(source)
+    if source_ivf is not None:
+        # IVF indexes need a direct map to reconstruct vectors by id
+        source_ivf.make_direct_map()
+    vectors = source.reconstruct_n(0, source.ntotal)
+    factory = args.factory or choose_factory(source.ntotal)
+    print(f"Rebuilding {source.ntotal} vectors (d={source.d}) as {factory}...")
+
+    # Keep the source metric so LangChain's relevance scores stay comparable
+    index = faiss.index_factory(source.d, factory, source.metric_type)
+    if not index.is_trained:
+        rng = np.random.default_rng(0)
+        sample_size = min(source.ntotal, MAX_TRAINING_POINTS)
+        sample = vectors[rng.choice(source.ntotal, sample_size, replace=False)]
+        index.train(sample)
+    index.add(vectors)
+
+    tmp_file = INDEX_FILE + ".tmp"
+    faiss.write_index(index, tmp_file)
+    os.replace(tmp_file, INDEX_FILE)
+    print("Vector index rebuild complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Shared pytest configuration."""
+
+import os
+
+# Settings are loaded when app modules are imported; provide the required
+# values so unit tests run without a .env file
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-with-at-least-32-characters")
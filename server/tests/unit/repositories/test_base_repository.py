@@ -0,0 +1,89 @@
+"""Tests for BaseRepository keyset pagination."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.project_repository import ProjectRepository
+
+CREATED_AT = datetime(2024, 5, 17, 9, 30, tzinfo=timezone.utc)
+RECORD_ID = UUID("01890a5d-ac96-774b-bcce-b302099a8057")
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """Records executed statements and returns canned rows."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self.rows)
+
+
+def compile_sql(statement) -> str:
+    return str(
+        statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+class TestGetKeysetPage:
+    async def test_orders_by_created_at_then_id(self):
+        session = FakeSession()
+
+        await ProjectRepository(session).get_keyset_page(limit=10)
+
+        sql = compile_sql(session.statements[0])
+        assert "ORDER BY projects.created_at DESC, projects.id DESC" in sql
+
+    async def test_cursor_seeks_on_created_at_and_id(self):
+        session = FakeSession()
+
+        await ProjectRepository(session).get_keyset_page(limit=10, after=(CREATED_AT, RECORD_ID))
+
+        sql = compile_sql(session.statements[0])
+        # Rows sharing the cursor's created_at are split by id, not skipped
+        assert "(projects.created_at, projects.id) < (" in sql
+        assert str(RECORD_ID) in sql
+
+    async def test_fetches_one_extra_row_to_detect_more(self):
+        session = FakeSession(rows=range(4))
+
+        records, has_more = await ProjectRepository(session).get_keyset_page(limit=3)
+
+        assert "LIMIT 4" in compile_sql(session.statements[0])
+        assert records == [0, 1, 2]
+        assert has_more is True
+
+    @pytest.mark.parametrize("row_count", [0, 2, 3])
+    async def test_last_page_has_no_more(self, row_count):
+        session = FakeSession(rows=range(row_count))
+
+        records, has_more = await ProjectRepository(session).get_keyset_page(limit=3)
+
+        assert records == list(range(row_count))
+        assert has_more is False
+
+    async def test_skip_is_ignored_with_cursor(self):
+        session = FakeSession()
+        repo = ProjectRepository(session)
+
+        await repo.get_keyset_page(limit=10, skip=20)
+        await repo.get_keyset_page(limit=10, after=(CREATED_AT, RECORD_ID), skip=20)
+
+        assert "OFFSET 20" in compile_sql(session.statements[0])
+        assert "OFFSET" not in compile_sql(session.statements[1])
@@ -0,0 +1,57 @@
+"""Tests for extracting JSON objects from model output."""
+
+import json
+
+import pytest
+
+from app.formzed.service.json_utils import extract_json
+
+
+class TestExtractJson:
+    def test_bare_object(self):
+        assert extract_json('{"a": 1}') == '{"a": 1}'
+
+    def test_surrounding_prose_is_dropped(self):
+        text = 'Here is the survey:\n{"title": "Feedback"}\nLet me know if it works.'
+
+        assert extract_json(text) == '{"title": "Feedback"}'
+
+    def test_fenced_object(self):
+        text = 'Sure.\n```json\n{"pages": []}\n```\nDone.'
+
+        assert extract_json(text) == '{"pages": []}'
+
+    def test_fence_skips_braces_in_earlier_prose(self):
+        text = 'Use {placeholders} like this:\n```json\n{"title": "x"}\n```'
+
+        assert extract_json(text) == '{"title": "x"}'
+
+    def test_nested_braces(self):
+        obj = {"pages": [{"elements": [{"type": "text", "validators": [{"type": "email"}]}]}]}
+        text = f"Result: {json.dumps(obj)} trailing {{not json}}"
+
+        assert json.loads(extract_json(text)) == obj
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            {"html": "<p>{{name}}</p>"},
+            {"expression": "{age} > 18 and {name} notempty"},
+            {"text": "closing } and opening { braces"},
+            {"text": 'escaped quote \\" then } brace'},
+            {"text": 'ends with backslash \\', "next": "}"},
+        ],
+    )
+    def test_braces_inside_strings_are_ignored(self, obj):
+        text = f"```json\n{json.dumps(obj)}\n```"
+
+        assert json.loads(extract_json(text)) == obj
+
+    def test_first_of_several_objects(self):
+        assert extract_json('{"a": 1} {"b": 2}') == '{"a": 1}'
+
+    def test_unclosed_object_returns_the_rest(self):
+        assert extract_json('prefix {"a": {"b": 1}') == '{"a": {"b": 1}'
+
+    def test_text_without_object_is_returned_stripped(self):
+        assert extract_json("  no json here  ") == "no json here"
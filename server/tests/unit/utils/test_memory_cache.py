@@ -0,0 +1,82 @@
+"""Tests for the in-process TTL cache."""
+
+import pytest
+
+from app.cache import memory_cache
+from app.cache.memory_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic."""
+
+    class Clock:
+        now = 1000.0
+
+    monkeypatch.setattr(memory_cache.time, "monotonic", lambda: Clock.now)
+    return Clock
+
+
+class TestTTLCache:
+    def test_get_returns_default_on_miss(self):
+        cache = TTLCache(maxsize=2, ttl=10)
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("key", "value")
+
+        clock.now += 9.9
+        assert cache.get("key") == "value"
+
+        clock.now += 0.1
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("short", 1, ttl=1)
+        cache.set("long", 2)
+
+        clock.now += 5
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_set_existing_key_refreshes_value_and_ttl(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("key", "old")
+
+        clock.now += 8
+        cache.set("key", "new")
+        clock.now += 8
+
+        assert cache.get("key") == "new"
+        assert len(cache) == 1
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0
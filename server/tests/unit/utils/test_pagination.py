@@ -0,0 +1,84 @@
+"""Tests for keyset pagination cursors."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.api.deps import client_errors_as_bad_request
+from app.core.exceptions import AppException, ValidationError
+from app.utils.pagination import decode_cursor, encode_cursor
+
+CREATED_AT = datetime(2024, 5, 17, 9, 30, 12, 345678, tzinfo=timezone.utc)
+RECORD_ID = UUID("01890a5d-ac96-774b-bcce-b302099a8057")
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor(CREATED_AT, RECORD_ID)
+
+        assert decode_cursor(cursor) == (CREATED_AT, RECORD_ID)
+
+    def test_round_trip_keeps_timezone_and_microseconds(self):
+        created_at, _ = decode_cursor(encode_cursor(CREATED_AT, RECORD_ID))
+
+        assert created_at.tzinfo == timezone.utc
+        assert created_at.microsecond == 345678
+
+    def test_cursor_is_url_safe_without_padding(self):
+        cursor = encode_cursor(CREATED_AT, RECORD_ID)
+
+        assert "=" not in cursor
+        assert "+" not in cursor and "/" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            "",
+            "%%%",
+            # Valid base64 of text without the separator
+            "aGVsbG8",
+            # Truncated cursor
+            encode_cursor(CREATED_AT, RECORD_ID)[:-6],
+        ],
+    )
+    def test_invalid_cursor_raises_validation_error(self, cursor):
+        with pytest.raises(ValidationError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
+
+
+class TestInvalidCursorResponse:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        router = APIRouter(dependencies=[Depends(client_errors_as_bad_request)])
+
+        @router.get("/items")
+        async def list_items(cursor: str):
+            decode_cursor(cursor)
+            return {"items": []}
+
+        @app.exception_handler(AppException)
+        async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+            return JSONResponse(status_code=exc.status_code, content={"message": exc.message})
+
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_tampered_cursor_is_bad_request(self, client):
+        cursor = encode_cursor(CREATED_AT, RECORD_ID)
+        tampered = cursor[:-4] + ("AAAA" if not cursor.endswith("AAAA") else "BBBB")
+
+        response = client.get("/items", params={"cursor": tampered})
+
+        assert response.status_code == 400
+        assert response.json() == {"message": "Invalid pagination cursor"}
+
+    def test_valid_cursor_is_accepted(self, client):
+        response = client.get("/items", params={"cursor": encode_cursor(CREATED_AT, RECORD_ID)})
+
+        assert response.status_code == 200
@@ -0,0 +1,158 @@
+"""Tests for the endpoint response cache."""
+
+from uuid import UUID
+
+import orjson
+import pytest
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+
+from app.cache import response_cache
+from app.cache.response_cache import (
+    build_response_cache_key,
+    cache_response,
+    invalidate_response_cache,
+)
+from app.models.user import User
+
+USER_A = User(id=UUID("01890a5d-ac96-774b-bcce-b302099a8057"), email="a@example.com")
+USER_B = User(id=UUID("01890a5d-ac96-774b-bcce-b302099a8058"), email="b@example.com")
+
+
+class FakeCache:
+    """In-memory stand-in for CacheService that stores JSON like Redis does."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        raw = self.data.get(key)
+        return None if raw is None else orjson.loads(raw)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = orjson.dumps(value)
+        return True
+
+    async def increment(self, key, amount=1):
+        value = int(self.data.get(key, b"0")) + amount
+        self.data[key] = str(value).encode()
+        return value
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = FakeCache()
+
+    async def get_cache():
+        return fake
+
+    monkeypatch.setattr(response_cache, "_get_cache", get_cache)
+    return fake
+
+
+class TestBuildResponseCacheKey:
+    def test_key_layout(self):
+        key = build_response_cache_key("users", 3, "list_users", {"current_user": USER_A})
+
+        assert key.startswith(f"response_cache:users:3:list_users:{USER_A.id}:")
+
+    def test_scoped_per_user(self):
+        kwargs = {"skip": 0, "limit": 10}
+        key_a = build_response_cache_key("users", 0, "list_users", {**kwargs, "user": USER_A})
+        key_b = build_response_cache_key("users", 0, "list_users", {**kwargs, "user": USER_B})
+
+        assert key_a != key_b
+
+    def test_anonymous_without_user(self):
+        key = build_response_cache_key("users", 0, "list_users", {"skip": 0})
+
+        assert ":anonymous:" in key
+
+    def test_kwarg_order_does_not_matter(self):
+        first = build_response_cache_key("users", 0, "list_users", {"skip": 0, "limit": 10})
+        second = build_response_cache_key("users", 0, "list_users", {"limit": 10, "skip": 0})
+
+        assert first == second
+
+    def test_kwarg_values_change_the_key(self):
+        first = build_response_cache_key("users", 0, "list_users", {"skip": 0})
+        second = build_response_cache_key("users", 0, "list_users", {"skip": 10})
+
+        assert first != second
+
+    def test_non_scalar_kwargs_are_ignored(self):
+        plain = build_response_cache_key("users", 0, "list_users", {"skip": 0})
+        with_service = build_response_cache_key(
+            "users", 0, "list_users", {"skip": 0, "service": object()}
+        )
+
+        assert plain == with_service
+
+    def test_generation_changes_the_key(self):
+        first = build_response_cache_key("users", 0, "list_users", {})
+        second = build_response_cache_key("users", 1, "list_users", {})
+
+        assert first != second
+
+
+class TestCacheResponse:
+    async def test_second_call_is_served_from_cache(self, cache):
+        calls = []
+
+        @cache_response("users", ttl_seconds=60)
+        async def list_users(skip: int = 0):
+            calls.append(skip)
+            return {"items": [skip]}
+
+        assert await list_users(skip=1) == {"items": [1]}
+        assert await list_users(skip=1) == {"items": [1]}
+        assert calls == [1]
+
+    @pytest.mark.parametrize(
+        "make_response",
+        [
+            lambda: Response(status_code=304),
+            lambda: StreamingResponse(iter([b"chunk"])),
+        ],
+    )
+    async def test_non_200_and_streaming_responses_are_not_cached(self, cache, make_response):
+        calls = []
+
+        @cache_response("users", ttl_seconds=60)
+        async def export_users():
+            calls.append(None)
+            return make_response()
+
+        await export_users()
+        await export_users()
+
+        assert len(calls) == 2
+        assert cache.data == {}
+
+    async def test_invalidation_bumps_generation(self, cache):
+        calls = []
+
+        @cache_response("users", ttl_seconds=60)
+        async def list_users():
+            calls.append(None)
+            return {"count": len(calls)}
+
+        assert await list_users() == {"count": 1}
+        await invalidate_response_cache("users")
+
+        assert await list_users() == {"count": 2}
+        assert await list_users() == {"count": 2}
+        assert cache.data["response_cache:users:generation"] == b"1"
+
+    async def test_invalidation_is_per_namespace(self, cache):
+        calls = []
+
+        @cache_response("projects", ttl_seconds=60)
+        async def list_projects():
+            calls.append(None)
+            return {"count": len(calls)}
+
+        await list_projects()
+        await invalidate_response_cache("users")
+
+        assert await list_projects() == {"count": 1}
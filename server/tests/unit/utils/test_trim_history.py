@@ -0,0 +1,83 @@
+"""Tests for the formzed agents' chat history trimming."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from app.formzed.service import llm
+from app.formzed.service.llm import trim_history
+
+
+def turn(index: int, size: int = 200) -> list:
+    """A user message and the assistant's reply, each roughly size characters."""
+    return [
+        HumanMessage(content=f"question {index} " + "q" * size),
+        AIMessage(content=f"answer {index} " + "a" * size),
+    ]
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    """Set the history budget in tokens."""
+
+    def set_budget(tokens: int) -> None:
+        monkeypatch.setattr(llm, "MAX_HISTORY_TOKENS", tokens)
+
+    return set_budget
+
+
+class TestTrimHistory:
+    def test_history_within_budget_is_unchanged(self, budget):
+        budget(10_000)
+        messages = turn(1) + turn(2) + [HumanMessage(content="current")]
+
+        assert trim_history(messages) == messages
+
+    def test_oldest_turns_are_dropped_first(self, budget):
+        messages = turn(1) + turn(2) + turn(3) + [HumanMessage(content="current")]
+        budget(count_tokens_approximately(messages[2:]))
+
+        trimmed = trim_history(messages)
+
+        assert trimmed == messages[2:]
+
+    def test_result_never_starts_with_a_tool_result(self, budget):
+        tool_call = {"name": "search", "args": {"query": "x"}, "id": "call-1"}
+        messages = [
+            HumanMessage(content="find " + "q" * 200),
+            AIMessage(content="", tool_calls=[tool_call]),
+            ToolMessage(content="r" * 200, tool_call_id="call-1"),
+            AIMessage(content="found it"),
+            HumanMessage(content="current"),
+        ]
+        # Enough room for the tool result onwards, but not its tool call
+        budget(count_tokens_approximately(messages[2:]))
+
+        trimmed = trim_history(messages)
+
+        assert trimmed[0].type in ("human", "ai")
+        assert trimmed == messages[3:]
+
+    def test_current_turn_is_kept_when_it_exceeds_the_budget(self, budget):
+        budget(10)
+        current = HumanMessage(content="current " + "c" * 1000)
+        messages = turn(1) + [current]
+
+        assert trim_history(messages) == [current]
+
+    def test_current_turn_tool_loop_is_kept_whole(self, budget):
+        budget(10)
+        tool_call = {"name": "search", "args": {"query": "x"}, "id": "call-1"}
+        current_turn = [
+            HumanMessage(content="current"),
+            AIMessage(content="", tool_calls=[tool_call]),
+            ToolMessage(content="r" * 1000, tool_call_id="call-1"),
+        ]
+        messages = turn(1) + current_turn
+
+        assert trim_history(messages) == current_turn
+
+    def test_empty_history(self, budget):
+        budget(10)
+
+        assert trim_history([]) == []
@@ -0,0 +1,76 @@
+"""Tests for the SurveyJS schema validator."""
+
+import fastjsonschema
+
+from app.formzed.service.validator import (
+    SURVEY_VALIDATE,
+    strip_dangling_refs,
+    validate_json,
+)
+
+DEFINITIONS = {"question": {"type": "object"}}
+
+
+class TestStripDanglingRefs:
+    def test_keeps_resolvable_ref(self):
+        node = {"$ref": "#/definitions/question"}
+
+        assert strip_dangling_refs(node, DEFINITIONS) == node
+
+    def test_drops_missing_ref_and_keeps_siblings(self):
+        node = {"$ref": "#/definitions/missing", "description": "column"}
+
+        assert strip_dangling_refs(node, DEFINITIONS) == {"description": "column"}
+
+    def test_ignores_non_definition_refs(self):
+        node = {"$ref": "https://example.com/schema.json"}
+
+        assert strip_dangling_refs(node, DEFINITIONS) == node
+
+    def test_walks_nested_dicts_and_lists(self):
+        schema = {
+            "properties": {
+                "columns": {"items": {"$ref": "#/definitions/missing"}},
+                "elements": {
+                    "anyOf": [{"$ref": "#/definitions/question"}, {"$ref": "#/definitions/gone"}]
+                },
+            }
+        }
+
+        assert strip_dangling_refs(schema, DEFINITIONS) == {
+            "properties": {
+                "columns": {"items": {}},
+                "elements": {"anyOf": [{"$ref": "#/definitions/question"}, {}]},
+            }
+        }
+
+    def test_does_not_mutate_input(self):
+        node = {"items": [{"$ref": "#/definitions/missing"}]}
+
+        strip_dangling_refs(node, DEFINITIONS)
+
+        assert node == {"items": [{"$ref": "#/definitions/missing"}]}
+
+    def test_stripped_schema_compiles(self):
+        schema = {
+            "definitions": DEFINITIONS,
+            "type": "object",
+            "properties": {"layout": {"$ref": "#/definitions/missing"}},
+        }
+
+        validate = fastjsonschema.compile(strip_dangling_refs(schema, schema["definitions"]))
+
+        assert validate({"layout": "anything"}) == {"layout": "anything"}
+
+
+class TestValidateJson:
+    def test_survey_schema_compiles(self):
+        assert SURVEY_VALIDATE is not None
+
+    def test_valid_survey(self):
+        survey = {"pages": [{"name": "page1", "elements": [{"type": "text", "name": "q1"}]}]}
+
+        assert validate_json(survey) == "Valid"
+
+    def test_invalid_survey(self):
+        assert validate_json({"pages": "not a list"}).startswith("Validation Error:")